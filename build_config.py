@@ -112,10 +112,15 @@ class VoiceForgeBuildConfig:
             'httpx',
             'httpx._transports',
             'httpx._transports.default',
-            'ormsgpack',
-            'pydantic',
-            'pydantic.dataclasses',
-            'pydantic.main',
+            'h2',
+            'h2.config',
+            'h2.connection',
+            'h2.events',
+            'hpack',
+            'hyperframe',
+            'msgspec',
+            'msgspec.json',
+            'msgspec.msgpack',
             'cryptography',
             'cryptography.fernet',
             'chardet',
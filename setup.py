@@ -19,9 +19,8 @@ if requirements_file.exists():
 else:
     requirements = [
         "click>=8.0.0",
-        "httpx>=0.24.0", 
-        "ormsgpack>=1.2.0",
-        "pydantic>=2.0.0",
+        "httpx[http2]>=0.24.0",
+        "msgspec>=0.18.0",
         "python-dotenv>=1.0.0",
         "cryptography>=3.4.0",
         "chardet>=5.0.0"
@@ -5,8 +5,8 @@ A cross-platform CLI/GUI application that converts text files to high-quality
 MP3 audio using pluggable Text-to-Speech service providers.
 """
 
-__version__ = "1.0.0"
-__app_name__ = "VoiceForge"
+from ._meta import __version__, __app_name__
+
 __description__ = "Convert text files to MP3 audio using advanced TTS services"
 __author__ = "VoiceForge Team"
 __license__ = "MIT"
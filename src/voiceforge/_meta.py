@@ -0,0 +1,9 @@
+"""
+VoiceForge package metadata.
+
+Leaf module with no imports so launchers can read the version and app
+name without paying for the package __init__ or the CLI stack.
+"""
+
+__version__ = "1.0.0"
+__app_name__ = "VoiceForge"
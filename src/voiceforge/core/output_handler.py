@@ -5,15 +5,135 @@ Handles saving MP3 files and managing output directories.
 Provides file naming, versioning, and output validation functionality.
 """
 
+import functools
 import os
+from collections import defaultdict
+import re
 import shutil
+import subprocess
+import sys
+import time
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from datetime import datetime
 
 from ..utils.exceptions import FileError
 from ..utils.logger import get_logger, log_file_operation
 
+# Characters not allowed in filenames on various systems, as a cached
+# translation table so sanitizing is a single C-level pass
+_INVALID_CHARS_TABLE = str.maketrans({c: "_" for c in '<>:"/\\|?*'})
+
+# Anything outside this set is stripped from filename components
+_DISALLOWED_COMPONENT_RE = re.compile(r'[^A-Za-z0-9._-]')
+
+# Filenames made of only these characters need no further sanitizing
+_SAFE_FILENAME_RE = re.compile(r'[A-Za-z0-9._-]+\Z')
+
+_TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+
+_MB = 1 << 20
+
+# File-manager launcher chosen once at import time; Popen is used so we
+# don't block on the spawned file manager
+if sys.platform == "win32":
+    _OPEN_DIRECTORY = os.startfile
+elif sys.platform == "darwin":
+    def _OPEN_DIRECTORY(directory):
+        subprocess.Popen(["open", str(directory)])
+else:  # Linux and other Unix-like systems
+    def _OPEN_DIRECTORY(directory):
+        subprocess.Popen(["xdg-open", str(directory)])
+
+# Directory validation results are reused for a short window so batch saves
+# into the same directory don't repeat the stat/access/disk_usage probes
+_DIR_VALIDATION_TTL = 5.0
+_dir_validation_cache: Dict[str, tuple] = {}
+
+
+@functools.lru_cache(maxsize=128)
+def _ensure_directory(abs_path: str) -> None:
+    """
+    Create a directory (with parents) and confirm it is writable.
+
+    Memoized so saving many files into the same directory performs the
+    mkdir/access syscalls only once. Failures are not cached.
+    """
+    Path(abs_path).mkdir(parents=True, exist_ok=True)
+    if not os.access(abs_path, os.W_OK):
+        raise FileError(abs_path, "create", "Directory is not writable")
+
+
+class BatchedWriter:
+    """
+    Buffered writer for streamed audio chunks.
+
+    Accumulates incoming chunks and flushes them with a single
+    scatter-gather os.writev call per batch, so saving a stream of small
+    chunks does not pay one write syscall per chunk.
+    """
+
+    # Flush once this much data is pending
+    _FLUSH_THRESHOLD = 1 << 20  # 1 MiB
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._fd = os.open(str(self.path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        self._pending = []
+        self._pending_size = 0
+        self.bytes_written = 0
+
+    def write(self, chunk: bytes) -> None:
+        """Queue a chunk for writing, flushing when the batch is full."""
+        if not chunk:
+            return
+        self._pending.append(chunk)
+        self._pending_size += len(chunk)
+        if self._pending_size >= self._FLUSH_THRESHOLD:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write all pending chunks with as few syscalls as possible."""
+        buffers = self._pending
+        self._pending = []
+        self._pending_size = 0
+        if not hasattr(os, "writev"):
+            # Windows has no scatter-gather write; fall back to one
+            # os.write per buffer, still batched behind the threshold
+            for chunk in buffers:
+                view = memoryview(chunk)
+                while view:
+                    written = os.write(self._fd, view)
+                    self.bytes_written += written
+                    view = view[written:]
+            return
+        while buffers:
+            written = os.writev(self._fd, buffers[:1024])
+            self.bytes_written += written
+            # Drop fully written buffers; trim a partially written one
+            while written:
+                if written >= len(buffers[0]):
+                    written -= len(buffers.pop(0))
+                else:
+                    buffers[0] = memoryview(buffers[0])[written:]
+                    written = 0
+
+    def close(self) -> None:
+        """Flush pending chunks and close the file descriptor."""
+        if self._fd is None:
+            return
+        try:
+            self.flush()
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self) -> "BatchedWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
 
 class OutputHandler:
     """
@@ -58,64 +178,145 @@ class OutputHandler:
         # Ensure output directory exists
         self.ensure_directory_exists(output_path.parent)
         
-        # Handle file naming if file already exists
-        final_path = self._resolve_output_path(output_path, overwrite)
-        
+        final_path = output_path
+        tmp_path = None
+        claimed = False
+
         try:
-            # Write audio data to file
-            with open(final_path, 'wb') as f:
-                f.write(audio_data)
-            
-            # Verify file was written correctly
-            if not final_path.exists() or final_path.stat().st_size == 0:
+            # Handle file naming if file already exists (claims the name atomically)
+            final_path, fd = self._resolve_output_path(output_path, overwrite)
+            if fd is not None:
+                # The claimed placeholder holds the name; content arrives below
+                os.close(fd)
+                claimed = True
+
+            # Write to a private temp file first, then rename over the final
+            # name — rename is atomic, so a failed write never leaves a
+            # partial MP3 under the final name
+            tmp_path = final_path.with_name(f".{final_path.name}.{os.getpid()}.tmp")
+            fd = os.open(str(tmp_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+
+            # Sum the returned byte counts instead of re-statting the file
+            try:
+                written = 0
+                view = memoryview(audio_data)
+                while written < len(view):
+                    written += os.write(fd, view[written:])
+
+                # Large MP3s won't be read back by us — tell the kernel it can
+                # drop their pages instead of evicting genuinely hot data
+                if written > _MB and hasattr(os, "posix_fadvise"):
+                    try:
+                        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+                    except OSError:
+                        pass
+            finally:
+                os.close(fd)
+
+            if written != len(audio_data):
                 raise FileError(str(final_path), "write", "File was not written correctly")
-            
+
+            os.replace(tmp_path, final_path)
+
             log_file_operation(self.logger, "write", final_path, True)
             self.logger.info(f"Audio saved successfully: {final_path} ({len(audio_data)} bytes)")
             
             return final_path
             
         except Exception as e:
+            # Leave no temp file or empty placeholder behind
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+            if claimed:
+                try:
+                    os.unlink(final_path)
+                except OSError:
+                    pass
             log_file_operation(self.logger, "write", final_path, False)
             if isinstance(e, FileError):
                 raise
             raise FileError(str(final_path), "write", f"Failed to save audio file: {str(e)}")
     
-    def _resolve_output_path(self, desired_path: Path, overwrite: bool) -> Path:
+    def _resolve_output_path(self, desired_path: Path, overwrite: bool) -> tuple:
         """
         Resolve the actual output path, handling existing files.
-        
+
+        The chosen name is claimed atomically via O_CREAT|O_EXCL, so there is
+        no window between picking a free name and opening it.
+
         Args:
             desired_path (Path): Desired output path
             overwrite (bool): Whether to overwrite existing files
-            
+
         Returns:
-            Path: Resolved output path
+            Tuple[Path, Optional[int]]: Resolved output path, plus the open
+            descriptor of the claimed placeholder (None when overwriting —
+            the atomic rename in save_audio_file replaces the file wholesale)
         """
-        if not desired_path.exists() or overwrite:
-            return desired_path
-        
-        # Generate a unique filename
+        if overwrite:
+            return desired_path, None
+
+        # Fast path: claim the desired name if it is free
+        try:
+            fd = os.open(str(desired_path), os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+            return desired_path, fd
+        except FileExistsError:
+            pass
+
+        # Generate a unique "_N" filename
         base_path = desired_path.parent
         stem = desired_path.stem
         suffix = desired_path.suffix
-        
-        counter = 1
+
+        def candidate(counter: int) -> Path:
+            return base_path / f"{stem}_{counter}{suffix}"
+
         while True:
-            new_path = base_path / f"{stem}_{counter}{suffix}"
-            if not new_path.exists():
-                self.logger.info(f"File exists, using: {new_path}")
-                return new_path
-            counter += 1
-            
-            # Prevent infinite loop
-            if counter > 1000:
-                raise FileError(
-                    str(desired_path),
-                    "write",
-                    "Too many existing files with similar names"
-                )
+            # Exponentially probe for a free counter, then binary-search the
+            # last interval — O(log N) stats instead of N sequential checks.
+            low = high = 1
+            while candidate(high).exists():
+                low = high + 1
+                high *= 2
+                if high > 1000:
+                    raise FileError(
+                        str(desired_path),
+                        "write",
+                        "Too many existing files with similar names"
+                    )
+            while low < high:
+                mid = (low + high) // 2
+                if candidate(mid).exists():
+                    low = mid + 1
+                else:
+                    high = mid
+
+            new_path = candidate(low)
+            try:
+                fd = os.open(str(new_path), os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+            except FileExistsError:
+                # Lost a race for this slot; probe again
+                continue
+            self.logger.info(f"File exists, using: {new_path}")
+            return new_path, fd
     
+    def stream_writer(self, output_path: Path) -> BatchedWriter:
+        """
+        Open a batched writer for streaming audio chunks to a file.
+
+        Args:
+            output_path (Path): Path where the audio stream should be saved
+
+        Returns:
+            BatchedWriter: Context-manager writer that batches chunk writes
+        """
+        output_path = Path(output_path)
+        self.ensure_directory_exists(output_path.parent)
+        return BatchedWriter(output_path)
+
     def ensure_directory_exists(self, directory: Path) -> None:
         """
         Ensure a directory exists, creating it if necessary.
@@ -127,17 +328,7 @@ class OutputHandler:
             FileError: If directory cannot be created
         """
         try:
-            directory = Path(directory)
-            directory.mkdir(parents=True, exist_ok=True)
-            
-            # Verify directory is writable
-            if not os.access(directory, os.W_OK):
-                raise FileError(
-                    str(directory),
-                    "create",
-                    "Directory is not writable"
-                )
-                
+            _ensure_directory(os.path.abspath(str(directory)))
         except Exception as e:
             if isinstance(e, FileError):
                 raise
@@ -168,25 +359,23 @@ class OutputHandler:
         """
         # Remove extension from input filename
         base_name = Path(input_filename).stem
-        
-        # Build filename components
-        components = [base_name]
-        
-        if provider:
-            components.append(provider)
-        
-        if voice:
-            # Clean voice name for filename
-            clean_voice = self._clean_filename_component(voice)
-            components.append(clean_voice)
-        
-        if timestamp:
-            timestamp_str = datetime.now().strftime("%Y%m%d_%H%M%S")
-            components.append(timestamp_str)
-        
-        # Join components and add .mp3 extension
-        filename = "_".join(components) + ".mp3"
-        
+
+        # Clean voice name for filename
+        clean_voice = self._clean_filename_component(voice) if voice else ""
+        timestamp_str = datetime.now().strftime(_TIMESTAMP_FORMAT) if timestamp else ""
+
+        filename = (
+            f"{base_name}"
+            f"{'_' + provider if provider else ''}"
+            f"{'_' + clean_voice if clean_voice else ''}"
+            f"{'_' + timestamp_str if timestamp_str else ''}"
+            ".mp3"
+        )
+
+        # Already-safe names (common case) skip the sanitizer pass entirely
+        if _SAFE_FILENAME_RE.match(filename) and len(filename) <= 255:
+            return filename
+
         # Ensure filename is valid for the filesystem
         return self._sanitize_filename(filename)
     
@@ -202,7 +391,7 @@ class OutputHandler:
         """
         # Remove or replace problematic characters
         cleaned = component.replace(" ", "_")
-        cleaned = "".join(c for c in cleaned if c.isalnum() or c in "._-")
+        cleaned = _DISALLOWED_COMPONENT_RE.sub("", cleaned)
         return cleaned[:50]  # Limit length
     
     def _sanitize_filename(self, filename: str) -> str:
@@ -215,12 +404,8 @@ class OutputHandler:
         Returns:
             str: Sanitized filename
         """
-        # Characters not allowed in filenames on various systems
-        invalid_chars = '<>:"/\\|?*'
-        
-        for char in invalid_chars:
-            filename = filename.replace(char, "_")
-        
+        filename = filename.translate(_INVALID_CHARS_TABLE)
+
         # Remove leading/trailing dots and spaces
         filename = filename.strip(". ")
         
@@ -295,7 +480,9 @@ class OutputHandler:
             Dict[str, Any]: Output summary
         """
         summary = {
-            'timestamp': datetime.now().isoformat(),
+            # time.strftime skips datetime object construction and
+            # microsecond formatting — summaries don't need them
+            'timestamp': time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime()),
             'total_files': len(output_files),
             'output_files': [],
             'total_size_bytes': 0,
@@ -303,19 +490,38 @@ class OutputHandler:
             'total_cost': total_cost
         }
         
+        # Group files by parent directory and stat them in one scandir sweep
+        # per directory instead of exists()+stat() per file
+        by_parent = defaultdict(set)
         for file_path in output_files:
             file_path = Path(file_path)
-            if file_path.exists():
+            by_parent[file_path.parent].add(file_path.name)
+
+        sizes = {}
+        for parent, names in by_parent.items():
+            try:
+                with os.scandir(parent) as entries:
+                    for entry in entries:
+                        if entry.name in names:
+                            sizes[(parent, entry.name)] = entry.stat(follow_symlinks=False).st_size
+            except OSError:
+                continue
+
+        for file_path in output_files:
+            file_path = Path(file_path)
+            size_bytes = sizes.get((file_path.parent, file_path.name))
+            if size_bytes is not None:
                 file_info = {
                     'path': str(file_path),
                     'name': file_path.name,
-                    'size_bytes': file_path.stat().st_size,
-                    'size_mb': file_path.stat().st_size / (1024 * 1024)
+                    'size_bytes': size_bytes
                 }
                 summary['output_files'].append(file_info)
-                summary['total_size_bytes'] += file_info['size_bytes']
-        
-        summary['total_size_mb'] = summary['total_size_bytes'] / (1024 * 1024)
+                summary['total_size_bytes'] += size_bytes
+
+        # Megabytes are derived once for the whole batch; per-file consumers
+        # can compute size_bytes / _MB on demand
+        summary['total_size_mb'] = summary['total_size_bytes'] / _MB
         
         return summary
     
@@ -335,16 +541,8 @@ class OutputHandler:
                 self.logger.warning(f"Directory does not exist: {directory}")
                 return False
             
-            import subprocess
-            import sys
-            
-            if sys.platform == "win32":
-                os.startfile(directory)
-            elif sys.platform == "darwin":
-                subprocess.run(["open", directory])
-            else:  # Linux and other Unix-like systems
-                subprocess.run(["xdg-open", directory])
-            
+            _OPEN_DIRECTORY(directory)
+
             self.logger.info(f"Opened directory: {directory}")
             return True
             
@@ -366,7 +564,7 @@ class OutputHandler:
         except Exception as e:
             self.logger.warning(f"Failed to clean up temporary directory {temp_dir}: {e}")
     
-    def validate_output_directory(self, directory: Path) -> tuple[bool, str]:
+    def validate_output_directory(self, directory: Path) -> Tuple[bool, str]:
         """
         Validate that an output directory is suitable for use.
         
@@ -374,11 +572,28 @@ class OutputHandler:
             directory (Path): Directory to validate
             
         Returns:
-            tuple[bool, str]: (is_valid, error_message)
+            Tuple[bool, str]: (is_valid, error_message)
         """
         try:
             directory = Path(directory)
-            
+
+            # Reuse a recent validation of the same directory
+            cache_key = os.path.abspath(str(directory))
+            cached = _dir_validation_cache.get(cache_key)
+            now = time.monotonic()
+            if cached and (now - cached[0]) < _DIR_VALIDATION_TTL:
+                return cached[1], cached[2]
+
+            is_valid, error = self._check_output_directory(directory)
+            _dir_validation_cache[cache_key] = (now, is_valid, error)
+            return is_valid, error
+
+        except Exception as e:
+            return False, f"Validation error: {str(e)}"
+
+    def _check_output_directory(self, directory: Path) -> Tuple[bool, str]:
+        """Run the actual directory validation probes (uncached)."""
+        try:
             # Check if directory exists or can be created
             if not directory.exists():
                 try:
@@ -397,7 +612,7 @@ class OutputHandler:
             # Check available space (basic check)
             try:
                 stat = shutil.disk_usage(directory)
-                free_space_mb = stat.free / (1024 * 1024)
+                free_space_mb = stat.free / _MB
                 if free_space_mb < 10:  # Less than 10MB free
                     return False, f"Insufficient disk space ({free_space_mb:.1f}MB available)"
             except Exception:
@@ -5,11 +5,12 @@ This module defines predefined speech types with optimized parameter sets
 for different use cases like audiobooks, presentations, podcasts, etc.
 """
 
+from types import MappingProxyType
 from typing import Dict, Any, List
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True)
 class SpeechPreset:
     """Represents a speech preset with optimized parameters."""
     name: str
@@ -21,28 +22,85 @@ class SpeechPreset:
     paragraph_pause: str
     use_case: str
     natural_speech: bool = True
-    
-    def to_settings_dict(self) -> Dict[str, Any]:
-        """Convert preset to settings dictionary for TTS client."""
-        return {
+
+    def __post_init__(self):
+        # Settings are a pure function of the frozen fields, so build the
+        # dictionary once and hand out a shared read-only view.
+        settings = MappingProxyType({
             "natural_speech": self.natural_speech,
             "speech_speed": self.speech_speed,
             "temperature": self.temperature,
             "top_p": self.top_p,
             "paragraph_pause": self.paragraph_pause,
             "enable_preprocessing": self.natural_speech,
-            "prosody": {
+            "prosody": MappingProxyType({
                 "speed": self.speech_speed,
                 "volume": 0
-            }
-        }
+            })
+        })
+        object.__setattr__(self, "_settings", settings)
+
+    def to_settings_dict(self) -> Dict[str, Any]:
+        """Get the settings mapping for the TTS client (read-only view)."""
+        return self._settings
+
+    def copy_settings(self) -> Dict[str, Any]:
+        """Get a mutable copy of the settings for callers that adjust them."""
+        settings = dict(self._settings)
+        settings["prosody"] = dict(settings["prosody"])
+        return settings
 
 
 class SpeechPresets:
     """Collection of predefined speech type presets."""
     
-    # Define all available presets
-    PRESETS = {
+    # Define all available presets, in sorted order so name listings need no
+    # per-call sort (read-only view so callers can share it safely)
+    PRESETS = MappingProxyType({
+        "audiobook": SpeechPreset(
+            name="Audiobook",
+            description="Optimized for long-form audiobook narration with clear pacing",
+            voice_preference="b545c585f631496c914815291da4e893",  # New default female voice
+            speech_speed=0.8,
+            temperature=0.5,
+            top_p=0.6,
+            paragraph_pause="long",
+            use_case="Long-form audiobooks, novels, literature"
+        ),
+
+        "conversational": SpeechPreset(
+            name="Conversational",
+            description="Natural, casual speech for everyday content",
+            voice_preference="b545c585f631496c914815291da4e893",  # New default female voice
+            speech_speed=0.9,
+            temperature=0.7,
+            top_p=0.7,
+            paragraph_pause="short",
+            use_case="Casual content, blogs, personal messages"
+        ),
+
+        "dramatic": SpeechPreset(
+            name="Dramatic",
+            description="Expressive, theatrical speech for dramatic content",
+            voice_preference="b545c585f631496c914815291da4e893",  # New default female voice
+            speech_speed=0.8,
+            temperature=0.8,
+            top_p=0.8,
+            paragraph_pause="medium",
+            use_case="Dramatic readings, theater, emotional content"
+        ),
+
+        "educational": SpeechPreset(
+            name="Educational",
+            description="Clear, engaging speech for educational content and tutorials",
+            voice_preference="b545c585f631496c914815291da4e893",  # New default female voice
+            speech_speed=0.85,
+            temperature=0.6,
+            top_p=0.7,
+            paragraph_pause="medium",
+            use_case="Educational content, tutorials, e-learning"
+        ),
+
         "female-narrator": SpeechPreset(
             name="Female Narrator",
             description="Professional female narrator for audiobooks and storytelling",
@@ -53,7 +111,7 @@ class SpeechPresets:
             paragraph_pause="long",
             use_case="Audiobooks, storytelling, professional narration"
         ),
-        
+
         "male-narrator": SpeechPreset(
             name="Male Narrator",
             description="Professional male narrator for audiobooks and documentaries",
@@ -64,40 +122,29 @@ class SpeechPresets:
             paragraph_pause="long",
             use_case="Audiobooks, documentaries, professional narration"
         ),
-        
-        "audiobook": SpeechPreset(
-            name="Audiobook",
-            description="Optimized for long-form audiobook narration with clear pacing",
+
+        "meditation": SpeechPreset(
+            name="Meditation",
+            description="Calm, soothing speech for meditation and relaxation content",
             voice_preference="b545c585f631496c914815291da4e893",  # New default female voice
-            speech_speed=0.8,
+            speech_speed=0.75,
             temperature=0.5,
             top_p=0.6,
             paragraph_pause="long",
-            use_case="Long-form audiobooks, novels, literature"
+            use_case="Meditation guides, relaxation, mindfulness content"
         ),
-        
-        "presentation": SpeechPreset(
-            name="Presentation",
-            description="Clear, professional speech for business presentations",
+
+        "news": SpeechPreset(
+            name="News",
+            description="Professional, authoritative speech for news and announcements",
             voice_preference="802e3bc2b27e49c2995d23ef70e6ac89",  # Energetic Male
-            speech_speed=0.9,
+            speech_speed=0.95,
             temperature=0.4,
             top_p=0.6,
-            paragraph_pause="medium",
-            use_case="Business presentations, corporate content, training"
-        ),
-        
-        "educational": SpeechPreset(
-            name="Educational",
-            description="Clear, engaging speech for educational content and tutorials",
-            voice_preference="b545c585f631496c914815291da4e893",  # New default female voice
-            speech_speed=0.85,
-            temperature=0.6,
-            top_p=0.7,
-            paragraph_pause="medium",
-            use_case="Educational content, tutorials, e-learning"
+            paragraph_pause="short",
+            use_case="News broadcasts, announcements, formal content"
         ),
-        
+
         "podcast": SpeechPreset(
             name="Podcast",
             description="Conversational, natural speech for podcast content",
@@ -108,18 +155,18 @@ class SpeechPresets:
             paragraph_pause="short",
             use_case="Podcasts, conversational content, interviews"
         ),
-        
-        "news": SpeechPreset(
-            name="News",
-            description="Professional, authoritative speech for news and announcements",
+
+        "presentation": SpeechPreset(
+            name="Presentation",
+            description="Clear, professional speech for business presentations",
             voice_preference="802e3bc2b27e49c2995d23ef70e6ac89",  # Energetic Male
-            speech_speed=0.95,
+            speech_speed=0.9,
             temperature=0.4,
             top_p=0.6,
-            paragraph_pause="short",
-            use_case="News broadcasts, announcements, formal content"
+            paragraph_pause="medium",
+            use_case="Business presentations, corporate content, training"
         ),
-        
+
         "storytelling": SpeechPreset(
             name="Storytelling",
             description="Expressive, engaging speech for stories and creative content",
@@ -130,18 +177,7 @@ class SpeechPresets:
             paragraph_pause="medium",
             use_case="Stories, creative writing, children's content"
         ),
-        
-        "meditation": SpeechPreset(
-            name="Meditation",
-            description="Calm, soothing speech for meditation and relaxation content",
-            voice_preference="b545c585f631496c914815291da4e893",  # New default female voice
-            speech_speed=0.75,
-            temperature=0.5,
-            top_p=0.6,
-            paragraph_pause="long",
-            use_case="Meditation guides, relaxation, mindfulness content"
-        ),
-        
+
         "technical": SpeechPreset(
             name="Technical",
             description="Clear, precise speech for technical documentation and manuals",
@@ -151,53 +187,40 @@ class SpeechPresets:
             top_p=0.6,
             paragraph_pause="medium",
             use_case="Technical documentation, manuals, specifications"
-        ),
-        
-        "conversational": SpeechPreset(
-            name="Conversational",
-            description="Natural, casual speech for everyday content",
-            voice_preference="b545c585f631496c914815291da4e893",  # New default female voice
-            speech_speed=0.9,
-            temperature=0.7,
-            top_p=0.7,
-            paragraph_pause="short",
-            use_case="Casual content, blogs, personal messages"
-        ),
-        
-        "dramatic": SpeechPreset(
-            name="Dramatic",
-            description="Expressive, theatrical speech for dramatic content",
-            voice_preference="b545c585f631496c914815291da4e893",  # New default female voice
-            speech_speed=0.8,
-            temperature=0.8,
-            top_p=0.8,
-            paragraph_pause="medium",
-            use_case="Dramatic readings, theater, emotional content"
         )
-    }
-    
+    })
+
+    # Cached name lists so repeated CLI calls don't rebuild/sort them
+    _PRESET_NAMES = tuple(PRESETS.keys())
+    _PRESET_CHOICES = _PRESET_NAMES
+
+    # Case-insensitive alias map so mixed-case lookups hit a single dict
+    _PRESETS_CI = MappingProxyType({key.casefold(): preset for key, preset in PRESETS.items()})
+
     @classmethod
     def get_preset(cls, preset_name: str) -> SpeechPreset:
-        """Get a speech preset by name."""
-        if preset_name not in cls.PRESETS:
-            available = list(cls.PRESETS.keys())
-            raise ValueError(f"Unknown speech preset '{preset_name}'. Available: {', '.join(available)}")
-        return cls.PRESETS[preset_name]
+        """Get a speech preset by name (case-insensitive)."""
+        preset = cls.PRESETS.get(preset_name) or cls._PRESETS_CI.get(preset_name.casefold())
+        if preset is None:
+            raise ValueError(
+                f"Unknown speech preset '{preset_name}'. Available: {', '.join(cls._PRESET_NAMES)}"
+            )
+        return preset
     
     @classmethod
     def get_all_presets(cls) -> Dict[str, SpeechPreset]:
-        """Get all available speech presets."""
-        return cls.PRESETS.copy()
-    
+        """Get all available speech presets (read-only mapping)."""
+        return cls.PRESETS
+
     @classmethod
     def get_preset_names(cls) -> List[str]:
         """Get list of all preset names."""
-        return list(cls.PRESETS.keys())
-    
+        return list(cls._PRESET_NAMES)
+
     @classmethod
     def get_preset_choices(cls) -> List[str]:
         """Get list of preset names for CLI choices."""
-        return sorted(cls.PRESETS.keys())
+        return list(cls._PRESET_CHOICES)
     
     @classmethod
     def describe_preset(cls, preset_name: str) -> str:
@@ -209,7 +232,7 @@ class SpeechPresets:
     def list_all_presets(cls) -> str:
         """Get a formatted list of all presets with descriptions."""
         lines = ["Available Speech Types:"]
-        for name, preset in sorted(cls.PRESETS.items()):
+        for name, preset in cls.PRESETS.items():
             lines.append(f"  • {name}: {preset.description}")
             lines.append(f"    Use case: {preset.use_case}")
             lines.append(f"    Parameters: speed={preset.speech_speed}, temp={preset.temperature}, top_p={preset.top_p}")
@@ -1,24 +1,26 @@
 """
 TTS Service Interface
 
-Abstract base class defining the contract for all TTS service providers.
+Protocol defining the contract for all TTS service providers.
 This interface ensures consistent behavior across different TTS services.
 """
 
-from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Protocol, runtime_checkable
 from pathlib import Path
 
 
-class TTSServiceInterface(ABC):
+@runtime_checkable
+class TTSServiceInterface(Protocol):
     """
-    Abstract base class for TTS service providers.
-    
-    All TTS service implementations must inherit from this class and implement
-    all abstract methods to ensure consistent behavior across providers.
+    Protocol for TTS service providers.
+
+    TTS service implementations subclass this Protocol (or simply match its
+    structure) to provide consistent behavior across providers. Using a
+    Protocol instead of an ABC avoids the ABCMeta bookkeeping on class
+    creation and instantiation while static analyzers still enforce the
+    contract.
     """
 
-    @abstractmethod
     def get_name(self) -> str:
         """
         Get the name of the TTS service provider.
@@ -26,9 +28,8 @@ class TTSServiceInterface(ABC):
         Returns:
             str: The name of the TTS service (e.g., "Fish Audio", "OpenAI TTS")
         """
-        pass
+        ...
 
-    @abstractmethod
     def get_available_voices(self, api_key: str) -> Dict[str, Any]:
         """
         Retrieve available voices/models from the TTS service.
@@ -43,9 +44,8 @@ class TTSServiceInterface(ABC):
             AuthenticationError: If API key is invalid
             NetworkError: If unable to connect to the service
         """
-        pass
+        ...
 
-    @abstractmethod
     def estimate_cost(
         self, 
         text: str, 
@@ -63,9 +63,8 @@ class TTSServiceInterface(ABC):
         Returns:
             Optional[str]: Formatted cost estimate string, or None if not available
         """
-        pass
+        ...
 
-    @abstractmethod
     def text_to_speech(
         self,
         api_key: str,
@@ -94,9 +93,39 @@ class TTSServiceInterface(ABC):
             NetworkError: If unable to connect to the service
             FileError: If unable to write output file
         """
-        pass
+        ...
+
+    def text_to_speech_batch(
+        self,
+        api_key: str,
+        items: List[tuple],
+        mp3_bitrate: int = 128,
+        extra_settings: Optional[Dict[str, Any]] = None
+    ) -> List[bool]:
+        """
+        Convert several texts to speech, allowing provider-side coalescing.
+
+        Providers with a batch endpoint (or connection multiplexing) should
+        override this to amortize connection setup across all items; the
+        default implementation simply loops over text_to_speech.
+
+        Args:
+            api_key (str): The API key for authentication
+            items (List[tuple]): (text, output_file_path, voice_or_model) triples
+            mp3_bitrate (int): MP3 bitrate (default: 128)
+            extra_settings (Optional[Dict[str, Any]]): Additional provider-specific settings
+
+        Returns:
+            List[bool]: Per-item success flags, in input order
+        """
+        return [
+            self.text_to_speech(
+                api_key, text, output_file_path, voice_or_model,
+                mp3_bitrate, extra_settings
+            )
+            for text, output_file_path, voice_or_model in items
+        ]
 
-    @abstractmethod
     def get_required_config_fields(self) -> List[str]:
         """
         Get the list of required configuration fields for this provider.
@@ -104,9 +133,8 @@ class TTSServiceInterface(ABC):
         Returns:
             List[str]: List of required configuration field names
         """
-        pass
+        ...
 
-    @abstractmethod
     def validate_api_key(self, api_key: str) -> bool:
         """
         Validate the provided API key.
@@ -117,7 +145,7 @@ class TTSServiceInterface(ABC):
         Returns:
             bool: True if API key is valid, False otherwise
         """
-        pass
+        ...
 
     def get_default_settings(self) -> Dict[str, Any]:
         """
@@ -131,7 +159,6 @@ class TTSServiceInterface(ABC):
             "voice": self.get_default_voice(),
         }
 
-    @abstractmethod
     def get_default_voice(self) -> str:
         """
         Get the default voice/model for this provider.
@@ -139,7 +166,7 @@ class TTSServiceInterface(ABC):
         Returns:
             str: Default voice/model identifier
         """
-        pass
+        ...
 
     def get_supported_formats(self) -> List[str]:
         """
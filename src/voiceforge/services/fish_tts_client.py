@@ -5,205 +5,343 @@ Implementation of TTSServiceInterface for Fish Audio TTS service.
 Handles Fish Audio API communication, authentication, and audio generation.
 """
 
+import asyncio
+import atexit
+import functools
+import hashlib
+import itertools
+import logging
+import math
+import os
 import time
 import re
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 import httpx
-import ormsgpack
-from pydantic import BaseModel
+import msgspec
 
 from ..interfaces.tts_service_interface import TTSServiceInterface
 from ..utils.exceptions import AuthenticationError, NetworkError, TTSServiceError
 from ..utils.logger import get_logger, log_api_request
 
 
-class ServeTTSRequest(BaseModel):
+class ServeTTSRequest(msgspec.Struct, omit_defaults=True):
     """Fish Audio TTS request model."""
     text: str
     format: str = "mp3"
     mp3_bitrate: int = 128
-    model: str = "speech-1.6"
+    reference_id: Optional[str] = None
+
+
+class VoiceItem(msgspec.Struct, rename={"id": "_id"}):
+    """One voice model entry from the Fish Audio models endpoint."""
+    id: str = "unknown"
+    title: str = "Unknown Voice"
+    description: str = ""
+    languages: List[str] = msgspec.field(default_factory=lambda: ["en"])
+    type: str = ""
+    author: Dict[str, Any] = {}
+    like_count: int = 0
+    task_count: int = 0
+    tags: List[str] = []
+    samples: List[Dict[str, Any]] = []
+
+
+class ModelsResponse(msgspec.Struct):
+    """Paginated models listing from the Fish Audio models endpoint."""
+    total: int = 0
+    items: List[VoiceItem] = []
+
+
+def _write_all(fd: int, chunk: bytes) -> None:
+    """Write a whole chunk to a raw fd, handling partial writes."""
+    mv = memoryview(chunk)
+    while mv:
+        mv = mv[os.write(fd, mv):]
+
+
+# Shared msgpack encoder — msgspec serializes the trivial request payload
+# without the per-field validation a pydantic model would re-run each call
+_ENCODER = msgspec.msgpack.Encoder()
+
+# Typed JSON decoder for the models listing: decoding straight into structs
+# skips the dict-of-dicts intermediate that response.json() would build
+_MODELS_DECODER = msgspec.json.Decoder(ModelsResponse)
+
+# For AI models the body only varies in `text`, so splice the encoded text
+# between prebuilt msgpack fragments instead of running the full serializer:
+# fixmap(3) + "text" key, then "format": "mp3" + "mp3_bitrate" key
+_AI_BODY_HEADER = b"\x83\xa4text"
+
+# Fish Audio API keys are long alphanumeric tokens; precompiled so obviously
+# malformed keys are rejected without a network round-trip
+_API_KEY_RE = re.compile(r"^[A-Za-z0-9]{20,}$")
+
+
+@functools.lru_cache(maxsize=8)
+def _ai_body_suffix(mp3_bitrate: int) -> bytes:
+    """Encoded trailing fields of an AI-model request body."""
+    return b"\xa6format\xa3mp3\xabmp3_bitrate" + _ENCODER.encode(mp3_bitrate)
+
+# Time constant for the no-content-length progress curve: reach ~63% of the
+# 40-90% band after 8s, ~86% after 16s
+_PROGRESS_TAU = 8.0
+
+# On-disk models cache so a fresh process can revalidate with a conditional
+# GET instead of re-downloading and re-parsing the full listing
+_MODELS_DISK_CACHE = Path.home() / ".cache" / "voiceforge" / "fish_models.mp"
+
+# Interned copies of strings repeated across model entries, so a 100-voice
+# listing shares one object per language/type/author instead of N copies
+_LANG_INTERN = {l: sys.intern(l) for l in ("en", "zh", "ja", "ko", "fr", "de", "es", "ar")}
+_TYPE_HUMAN = sys.intern("human")
+
+# Built-in AI model entries prepended to every processed listing
+_AI_MODEL_ENTRIES = (
+    {
+        "id": "speech-1.6",
+        "name": "Speech 1.6 (AI)",
+        "description": "Latest Fish Audio AI speech model",
+        "languages": ["en", "zh", "ja", "ko", "fr", "de", "es", "ar"],
+        "type": "ai",
+        "author": "Fish Audio"
+    },
+    {
+        "id": "speech-1.5",
+        "name": "Speech 1.5 (AI)",
+        "description": "Previous generation AI speech model",
+        "languages": ["en", "zh", "ja"],
+        "type": "ai",
+        "author": "Fish Audio"
+    }
+)
+
+# Static fallback returned whenever the models endpoint is unreachable
+_DEFAULT_MODELS_RESPONSE = {
+    "provider": "Fish Audio",
+    "models": [
+        {
+            "id": "speech-1.6",
+            "name": "Speech 1.6",
+            "description": "Latest Fish Audio speech model",
+            "languages": ["en", "zh", "ja", "ko", "fr", "de", "es", "ar"]
+        },
+        {
+            "id": "speech-1.4",
+            "name": "Speech 1.4",
+            "description": "Previous generation speech model",
+            "languages": ["en", "zh", "ja"]
+        }
+    ],
+    "default_model": "speech-1.6"
+}
 
 
 class FishTTSClient(TTSServiceInterface):
     """
     Fish Audio TTS service client.
-    
+
     Implements the TTSServiceInterface for Fish Audio's TTS API.
     Uses msgpack for request serialization and supports various voices/models.
     """
-    
+
     BASE_URL = "https://api.fish.audio"
     TTS_ENDPOINT = "/v1/tts"
     MODELS_ENDPOINT = "/model"
-    
+
+    # How long a validate_api_key result stays good for (seconds)
+    _VALIDATION_TTL = 300
+
+    # Processed model listings shared across instances, since the factory
+    # returns a fresh client per create_service call; keyed by
+    # (api_key_hash, limit) -> (processed_models, monotonic timestamp)
+    _models_cache_shared: Dict[tuple, tuple] = {}
+    _cache_lock = threading.Lock()
+
     # Estimated pricing (characters per dollar) - update based on actual Fish Audio pricing
     ESTIMATED_COST_PER_1K_CHARS = 0.015  # $0.015 per 1000 characters
-    
+
     DEFAULT_MODELS = [
         "speech-1.6",
         "speech-1.4", 
         "speech-1.2"
     ]
-    
+
     def __init__(self):
         """Initialize the Fish Audio TTS client."""
         self.logger = get_logger(__name__)
+        # Constant per instance; precomputed so hot paths skip the f-string
+        self._tts_url = self.BASE_URL + self.TTS_ENDPOINT
+        self._models_url = self.BASE_URL + self.MODELS_ENDPOINT
         self._client = None
-        self._models_cache = None
-        self._cache_timestamp = None
+        self._async_client = None
+        # Keys the pooled clients' Authorization headers were built from
+        self._last_api_key = None
+        self._last_async_api_key = None
         self._cache_duration = 3600  # Cache for 1 hour
-    
+        # Validation results keyed by key hash -> (monotonic ts, result)
+        self._validation_cache: Dict[str, tuple] = {}
+        # Output directories already created this process
+        self._known_dirs: set = set()
+
     def get_name(self) -> str:
         """Get the name of the TTS service provider."""
         return "Fish Audio"
-    
+
     def get_available_voices(self, api_key: str, limit: int = 20) -> Dict[str, Any]:
         """
         Retrieve available voices/models from Fish Audio.
-        
+
         Args:
             api_key (str): The API key for authentication
-            
+
         Returns:
             Dict[str, Any]: Dictionary containing available voices/models
         """
         try:
-            # Check cache first
-            if self._is_cache_valid():
+            # Check the shared cache first (warm across factory instances)
+            cache_key = (
+                hashlib.blake2b(api_key.encode(), digest_size=16).hexdigest(),
+                limit
+            )
+            with self._cache_lock:
+                cached = self._models_cache_shared.get(cache_key)
+            if cached is not None and time.monotonic() - cached[1] < self._cache_duration:
                 self.logger.debug("Using cached models")
-                return self._models_cache
-            
+                return cached[0]
+
             client = self._get_client(api_key)
-            
+
             log_api_request(self.logger, "Fish Audio", self.MODELS_ENDPOINT, "GET")
-            
-            # Add pagination parameters to get more voices
-            params = {
-                "page_size": min(limit, 100),  # Fish Audio max is 100 per page
-                "page_number": 1
-            }
-            
-            response = client.get(
-                f"{self.BASE_URL}{self.MODELS_ENDPOINT}",
-                params=params,
-                timeout=30.0
-            )
-            
-            if response.status_code == 401:
-                raise AuthenticationError("Fish Audio", "Invalid API key")
-            elif response.status_code != 200:
-                raise NetworkError(f"Fish Audio API error", response.status_code)
-            
-            models_data = response.json()
-            
+
+            # Fish Audio caps page_size at 100, so limits beyond that need
+            # several pages; fetch them in parallel over the keep-alive
+            # connection rather than serially paying one RTT per page
+            pages = math.ceil(limit / 100)
+
+            def fetch_page(page_number: int, headers: Optional[Dict[str, str]] = None) -> httpx.Response:
+                return client.get(
+                    self._models_url,
+                    params={
+                        "page_size": min(limit, 100),
+                        "page_number": page_number
+                    },
+                    headers=headers,
+                    timeout=30.0
+                )
+
+            if pages <= 1:
+                # Revalidate against the on-disk cache: a 304 costs a header
+                # round-trip instead of a full download and parse
+                etag, cached_limit, cached_models = self._load_models_disk_cache()
+                conditional = {"If-None-Match": etag} if etag and cached_limit == limit else None
+
+                responses = [fetch_page(1, conditional)]
+
+                if responses[0].status_code == 304 and cached_models is not None:
+                    self.logger.debug("Models unchanged (304), using disk cache")
+                    with self._cache_lock:
+                        self._models_cache_shared[cache_key] = (cached_models, time.monotonic())
+                    return cached_models
+            else:
+                with ThreadPoolExecutor(max_workers=pages) as executor:
+                    responses = list(executor.map(fetch_page, range(1, pages + 1)))
+
+            for response in responses:
+                if response.status_code == 401:
+                    raise AuthenticationError("Fish Audio", "Invalid API key")
+                elif response.status_code != 200:
+                    raise NetworkError(f"Fish Audio API error", response.status_code)
+
+            # Merge pages in order, keeping the first page's total
+            models_data = _MODELS_DECODER.decode(responses[0].content)
+            for response in responses[1:]:
+                models_data.items.extend(_MODELS_DECODER.decode(response.content).items)
+
             # Process and cache the models
             processed_models = self._process_models_response(models_data, limit)
-            self._models_cache = processed_models
-            self._cache_timestamp = time.time()
-            
-            self.logger.info(f"Retrieved {len(processed_models.get('models', []))} models from Fish Audio")
+            with self._cache_lock:
+                self._models_cache_shared[cache_key] = (processed_models, time.monotonic())
+
+            if pages <= 1:
+                self._store_models_disk_cache(
+                    responses[0].headers.get("etag"), limit, processed_models
+                )
+
+            self.logger.info("Retrieved %d models from Fish Audio", len(processed_models["models"]))
             return processed_models
-            
+
         except (AuthenticationError, NetworkError):
             raise
         except Exception as e:
             self.logger.error(f"Failed to get Fish Audio models: {e}")
             # Return default models as fallback
             return self._get_default_models()
-    
-    def _is_cache_valid(self) -> bool:
-        """Check if the models cache is still valid."""
-        if not self._models_cache or not self._cache_timestamp:
-            return False
-        return (time.time() - self._cache_timestamp) < self._cache_duration
-    
-    def _process_models_response(self, models_data: Dict, limit: int = 20) -> Dict[str, Any]:
-        """Process the models response from Fish Audio API."""
-        processed = {
+
+    def _load_models_disk_cache(self) -> tuple:
+        """Load (etag, limit, processed_models) from the on-disk cache."""
+        try:
+            payload = msgspec.msgpack.decode(_MODELS_DISK_CACHE.read_bytes())
+            return payload["etag"], payload["limit"], payload["models"]
+        except Exception:
+            return None, None, None
+
+    def _store_models_disk_cache(self, etag: Optional[str], limit: int, processed_models: Dict[str, Any]) -> None:
+        """Persist the ETag and processed models for conditional revalidation."""
+        if not etag:
+            return
+        try:
+            _MODELS_DISK_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            _MODELS_DISK_CACHE.write_bytes(msgspec.msgpack.encode({
+                "etag": etag,
+                "limit": limit,
+                "models": processed_models
+            }))
+        except OSError as e:
+            self.logger.debug("Could not write models disk cache: %s", e)
+
+    def _process_models_response(self, models_data: ModelsResponse, limit: int = 20) -> Dict[str, Any]:
+        """Process the decoded models response from Fish Audio API."""
+        # Default AI models first, then human voices up to the limit
+        models = [*_AI_MODEL_ENTRIES]
+        models.extend(
+            self._build_model_entry(item)
+            for item in models_data.items[:limit]
+            if item.type == "tts"
+        )
+
+        return {
             "provider": "Fish Audio",
-            "models": [],
+            "models": models,
             "default_model": "speech-1.6",
-            "total_available": 0
+            "total_available": models_data.total
         }
-        
-        # Handle Fish Audio API response format
-        if isinstance(models_data, dict):
-            # Get total count
-            processed["total_available"] = models_data.get("total", 0)
-            
-            # Process items (voice models)
-            items = models_data.get("items", [])
-            
-            # Add default AI models first
-            processed["models"].extend([
-                {
-                    "id": "speech-1.6",
-                    "name": "Speech 1.6 (AI)",
-                    "description": "Latest Fish Audio AI speech model",
-                    "languages": ["en", "zh", "ja", "ko", "fr", "de", "es", "ar"],
-                    "type": "ai",
-                    "author": "Fish Audio"
-                },
-                {
-                    "id": "speech-1.5", 
-                    "name": "Speech 1.5 (AI)",
-                    "description": "Previous generation AI speech model",
-                    "languages": ["en", "zh", "ja"],
-                    "type": "ai",
-                    "author": "Fish Audio"
-                }
-            ])
-            
-            # Add human voice models
-            for item in items[:limit]:  # Limit based on parameter
-                if isinstance(item, dict) and item.get("type") == "tts":
-                    # Get sample audio info if available
-                    samples = item.get("samples", [])
-                    sample_text = ""
-                    if samples and len(samples) > 0:
-                        sample_text = samples[0].get("text", "")[:100] + "..." if len(samples[0].get("text", "")) > 100 else samples[0].get("text", "")
-                    
-                    processed["models"].append({
-                        "id": item.get("_id", "unknown"),
-                        "name": item.get("title", "Unknown Voice"),
-                        "description": item.get("description", sample_text),
-                        "languages": item.get("languages", ["en"]),
-                        "type": "human",
-                        "author": item.get("author", {}).get("nickname", "Unknown"),
-                        "like_count": item.get("like_count", 0),
-                        "task_count": item.get("task_count", 0),
-                        "tags": item.get("tags", [])
-                    })
-        
-        # Fallback if no items found
-        if not processed["models"]:
-            processed = self._get_default_models()
-        
-        return processed
-    
-    def _get_default_models(self) -> Dict[str, Any]:
-        """Get default models when API is unavailable."""
+
+    @staticmethod
+    def _build_model_entry(item: VoiceItem) -> Dict[str, Any]:
+        """Build one processed model entry from a decoded voice item."""
+        description = item.description
+        if not description and item.samples:
+            description = item.samples[0].get("text", "")[:100]
         return {
-            "provider": "Fish Audio",
-            "models": [
-                {
-                    "id": "speech-1.6",
-                    "name": "Speech 1.6",
-                    "description": "Latest Fish Audio speech model",
-                    "languages": ["en", "zh", "ja", "ko", "fr", "de", "es", "ar"]
-                },
-                {
-                    "id": "speech-1.4", 
-                    "name": "Speech 1.4",
-                    "description": "Previous generation speech model",
-                    "languages": ["en", "zh", "ja"]
-                }
-            ],
-            "default_model": "speech-1.6"
+            "id": item.id,
+            "name": item.title,
+            "description": description,
+            "languages": [_LANG_INTERN.get(l) or sys.intern(l) for l in item.languages],
+            "type": _TYPE_HUMAN,
+            "author": sys.intern(item.author.get("nickname", "Unknown")),
+            "like_count": item.like_count,
+            "task_count": item.task_count,
+            "tags": item.tags
         }
-    
+
+    def _get_default_models(self) -> Dict[str, Any]:
+        """Get default models when API is unavailable."""
+        return _DEFAULT_MODELS_RESPONSE
+
     def estimate_cost(
         self, 
         text: str, 
@@ -212,32 +350,41 @@ class FishTTSClient(TTSServiceInterface):
     ) -> Optional[str]:
         """
         Estimate the cost for converting text to speech.
-        
+
         Args:
             text (str): The text to be converted
             voice_or_model (str): The voice or model to use
             settings (Optional[Dict[str, Any]]): Additional settings
-            
+
         Returns:
             Optional[str]: Formatted cost estimate string
         """
-        try:
-            char_count = len(text)
-            
-            # Calculate cost based on character count
-            cost_per_char = self.ESTIMATED_COST_PER_1K_CHARS / 1000
-            estimated_cost = char_count * cost_per_char
-            
-            # Format the cost estimate
-            if estimated_cost < 0.01:
-                return f"~$0.01 ({char_count:,} chars)"
-            else:
-                return f"~${estimated_cost:.3f} ({char_count:,} chars)"
-                
-        except Exception as e:
-            self.logger.warning(f"Failed to estimate cost: {e}")
-            return None
-    
+        return self._format_cost(len(text))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _format_cost(char_count: int) -> str:
+        """Format the cost estimate for a character count (memoized)."""
+        estimated_cost = char_count * (FishTTSClient.ESTIMATED_COST_PER_1K_CHARS / 1000)
+        if estimated_cost < 0.01:
+            return f"~$0.01 ({char_count:,} chars)"
+        return f"~${estimated_cost:.3f} ({char_count:,} chars)"
+
+    def estimate_costs_batch(self, texts: List[str]) -> List[str]:
+        """
+        Estimate costs for many text chunks in one pass.
+
+        Used during long-document splitting, where calling estimate_cost
+        per chunk would redo the rate division hundreds of times.
+
+        Args:
+            texts (List[str]): The text chunks to estimate
+
+        Returns:
+            List[str]: Formatted cost estimate strings, in input order
+        """
+        return [self._format_cost(n) for n in map(len, texts)]
+
     def estimate_output_size(
         self,
         text: str,
@@ -246,69 +393,359 @@ class FishTTSClient(TTSServiceInterface):
     ) -> Dict[str, Any]:
         """
         Estimate the output file size and duration for given text.
-        
+
         Args:
             text (str): The text to be converted
             mp3_bitrate (int): MP3 bitrate in kbps
             voice_or_model (str): The voice or model to use
-            
+
         Returns:
             Dict[str, Any]: Dictionary containing size and duration estimates
         """
-        try:
-            char_count = len(text)
+        char_count = len(text)
+        word_count = len(text.split())
+
+        # Estimate speech duration (average reading speed: 150-200 WPM)
+        words_per_minute = 160  # Conservative estimate
+        estimated_duration_minutes = word_count / words_per_minute
+        estimated_duration_seconds = estimated_duration_minutes * 60
+
+        # Estimate file size based on bitrate and duration
+        # MP3 file size = (bitrate in kbps * duration in seconds) / 8 / 1024 MB
+        estimated_size_mb = (mp3_bitrate * estimated_duration_seconds) / 8 / 1024
+        estimated_size_kb = estimated_size_mb * 1024
+
+        duration_str = self._format_duration(estimated_duration_minutes, estimated_duration_seconds)
+        size_str = self._format_size(estimated_size_mb, estimated_size_kb)
+
+        return {
+            "estimated_duration_seconds": estimated_duration_seconds,
+            "estimated_duration_str": duration_str,
+            "estimated_size_mb": estimated_size_mb,
+            "estimated_size_kb": estimated_size_kb,
+            "estimated_size_str": size_str,
+            "bitrate": mp3_bitrate,
+            "char_count": char_count,
+            "word_count": word_count,
+            "words_per_minute": words_per_minute
+        }
+
+    def estimate_output_size_batch(
+        self,
+        texts: List[str],
+        mp3_bitrate: int = 128
+    ) -> List[Dict[str, Any]]:
+        """
+        Estimate output size and duration for many text chunks in one pass.
+
+        Hoists the per-call rate constants out of the loop so previewing a
+        split document doesn't redo them per chunk.
+
+        Args:
+            texts (List[str]): The text chunks to estimate
+            mp3_bitrate (int): MP3 bitrate in kbps
+
+        Returns:
+            List[Dict[str, Any]]: Per-chunk estimates, in input order
+        """
+        words_per_minute = 160
+        seconds_per_word = 60.0 / words_per_minute
+        mb_per_second = mp3_bitrate / 8 / 1024
+
+        estimates = []
+        for text in texts:
             word_count = len(text.split())
-            
-            # Estimate speech duration (average reading speed: 150-200 WPM)
-            words_per_minute = 160  # Conservative estimate
-            estimated_duration_minutes = word_count / words_per_minute
-            estimated_duration_seconds = estimated_duration_minutes * 60
-            
-            # Estimate file size based on bitrate and duration
-            # MP3 file size = (bitrate in kbps * duration in seconds) / 8 / 1024 MB
-            estimated_size_mb = (mp3_bitrate * estimated_duration_seconds) / 8 / 1024
-            estimated_size_kb = estimated_size_mb * 1024
-            
-            # Format duration string
-            if estimated_duration_minutes < 1:
-                duration_str = f"{int(estimated_duration_seconds)}s"
-            elif estimated_duration_minutes < 60:
-                minutes = int(estimated_duration_minutes)
-                seconds = int((estimated_duration_minutes - minutes) * 60)
-                duration_str = f"{minutes}m {seconds}s"
-            else:
-                hours = int(estimated_duration_minutes // 60)
-                minutes = int(estimated_duration_minutes % 60)
-                duration_str = f"{hours}h {minutes}m"
-            
-            # Format file size
-            if estimated_size_mb < 1:
-                size_str = f"{estimated_size_kb:.0f} KB"
-            elif estimated_size_mb < 100:
-                size_str = f"{estimated_size_mb:.1f} MB"
-            else:
-                size_str = f"{estimated_size_mb:.0f} MB"
-            
-            return {
-                "estimated_duration_seconds": estimated_duration_seconds,
-                "estimated_duration_str": duration_str,
-                "estimated_size_mb": estimated_size_mb,
-                "estimated_size_kb": estimated_size_kb,
-                "estimated_size_str": size_str,
+            duration_seconds = word_count * seconds_per_word
+            duration_minutes = duration_seconds / 60
+            size_mb = duration_seconds * mb_per_second
+            size_kb = size_mb * 1024
+
+            estimates.append({
+                "estimated_duration_seconds": duration_seconds,
+                "estimated_duration_str": self._format_duration(duration_minutes, duration_seconds),
+                "estimated_size_mb": size_mb,
+                "estimated_size_kb": size_kb,
+                "estimated_size_str": self._format_size(size_mb, size_kb),
                 "bitrate": mp3_bitrate,
-                "char_count": char_count,
+                "char_count": len(text),
                 "word_count": word_count,
                 "words_per_minute": words_per_minute
-            }
-            
+            })
+
+        return estimates
+
+    @staticmethod
+    def _format_duration(duration_minutes: float, duration_seconds: float) -> str:
+        """Format an estimated duration as a short human-readable string."""
+        if duration_minutes < 1:
+            return f"{int(duration_seconds)}s"
+        if duration_minutes < 60:
+            minutes = int(duration_minutes)
+            seconds = int((duration_minutes - minutes) * 60)
+            return f"{minutes}m {seconds}s"
+        hours = int(duration_minutes // 60)
+        minutes = int(duration_minutes % 60)
+        return f"{hours}h {minutes}m"
+
+    @staticmethod
+    def _format_size(size_mb: float, size_kb: float) -> str:
+        """Format an estimated file size as a short human-readable string."""
+        if size_mb < 1:
+            return f"{size_kb:.0f} KB"
+        if size_mb < 100:
+            return f"{size_mb:.1f} MB"
+        return f"{size_mb:.0f} MB"
+
+    @staticmethod
+    def _download_progress(
+        bytes_downloaded: int,
+        content_length: int,
+        elapsed_time: float,
+        last_reported_progress: float
+    ) -> float:
+        """Estimate download progress within the 40-90% band."""
+        if content_length > 0:
+            estimated = 40 + (bytes_downloaded / content_length) * 50
+        else:
+            # No content length - smooth exponential approach toward 90%
+            # instead of the old size-banded heuristics
+            estimated = 40 + 50 * (1 - math.exp(-elapsed_time / _PROGRESS_TAU))
+
+        # Never go backwards; cap at 90% to leave room for verification
+        return min(90, max(estimated, last_reported_progress + 0.5))
+
+    def _ensure_parent_dir(self, output_file_path: Path) -> None:
+        """Create the output file's parent directory once per process."""
+        parent = output_file_path.parent
+        if parent not in self._known_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(parent)
+
+    def _build_tts_request(
+        self,
+        text: str,
+        voice_or_model: str,
+        mp3_bitrate: int
+    ) -> tuple:
+        """Build (request_body, headers, timeout) for a TTS call.
+
+        Authorization and Content-Type live on the pooled client's default
+        headers, so per-request headers are only needed for the AI-model case.
+        """
+        # Add model/voice handling
+        if voice_or_model and voice_or_model not in ["speech-1.6", "speech-1.5"]:
+            # Human voice model
+            headers = None
+            request_body = _ENCODER.encode(ServeTTSRequest(
+                text=text,
+                mp3_bitrate=mp3_bitrate,
+                reference_id=voice_or_model
+            ))
+        else:
+            # AI model - passed via header; body only varies in text, so
+            # splice it between the prebuilt fragments
+            headers = {"model": voice_or_model}
+            request_body = _AI_BODY_HEADER + _ENCODER.encode(text) + _ai_body_suffix(mp3_bitrate)
+
+        # Calculate timeout based on text length: 1 minute base plus
+        # 10 seconds per 1000 chars, capped at 4 extra minutes
+        total_timeout = 60 + min(240, len(text) // 1000 * 10)
+
+        return request_body, headers, total_timeout
+
+    def _get_async_client(self, api_key: str) -> "httpx.AsyncClient":
+        """Get or create the shared async HTTP client."""
+        if not self._async_client:
+            self._async_client = httpx.AsyncClient(
+                http2=True,
+                transport=httpx.AsyncHTTPTransport(retries=1),
+                headers={
+                    "Authorization": f"Bearer {api_key}",
+                    "Content-Type": "application/msgpack",
+                    "User-Agent": "VoiceForge/1.0.0"
+                },
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=20,
+                    keepalive_expiry=60.0
+                ),
+                timeout=httpx.Timeout(30.0, connect=5.0)
+            )
+            self._last_async_api_key = api_key
+        elif api_key != self._last_async_api_key:
+            self._async_client.headers["Authorization"] = f"Bearer {api_key}"
+            self._last_async_api_key = api_key
+
+        return self._async_client
+
+    async def aclose(self) -> None:
+        """Close the shared async HTTP client."""
+        if self._async_client:
+            try:
+                await self._async_client.aclose()
+            except Exception:
+                pass
+            self._async_client = None
+
+    async def text_to_speech_async(
+        self,
+        api_key: str,
+        text: str,
+        output_file_path: Path,
+        voice_or_model: str,
+        mp3_bitrate: int = 128,
+        extra_settings: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """
+        Convert text to speech using Fish Audio API without blocking the
+        event loop.
+
+        Callers converting many chunks can await several of these
+        concurrently (see text_to_speech_many); all requests share one
+        pooled HTTP/2 connection.
+
+        Args:
+            api_key (str): The API key for authentication
+            text (str): The text to convert to speech
+            output_file_path (Path): Path where the MP3 file should be saved
+            voice_or_model (str): The voice or model to use
+            mp3_bitrate (int): MP3 bitrate (default: 128)
+            extra_settings (Optional[Dict[str, Any]]): Additional settings
+
+        Returns:
+            bool: True if conversion was successful, False otherwise
+        """
+        try:
+            request_body, headers, total_timeout = self._build_tts_request(
+                text, voice_or_model, mp3_bitrate
+            )
+
+            log_api_request(self.logger, "Fish Audio", self.TTS_ENDPOINT)
+
+            client = self._get_async_client(api_key)
+
+            async with client.stream(
+                "POST",
+                self._tts_url,
+                content=request_body,
+                headers=headers,
+                timeout=total_timeout
+            ) as response:
+                if response.status_code == 401:
+                    raise AuthenticationError("Fish Audio", "Invalid API key")
+                elif response.status_code == 400:
+                    raise TTSServiceError("Fish Audio", "Bad request - check text and model parameters")
+                elif response.status_code == 429:
+                    raise TTSServiceError("Fish Audio", "Rate limit exceeded - please wait and try again")
+                elif response.status_code != 200:
+                    raise NetworkError(f"Fish Audio API error", response.status_code)
+
+                self._ensure_parent_dir(output_file_path)
+
+                bytes_downloaded = 0
+                with open(output_file_path, 'wb') as output_file:
+                    async for chunk in response.aiter_bytes(chunk_size=65536):
+                        output_file.write(chunk)
+                        bytes_downloaded += len(chunk)
+
+            if bytes_downloaded == 0:
+                raise TTSServiceError("Fish Audio", "Failed to save audio file")
+
+            self.logger.info(
+                f"TTS conversion successful: {len(text)} chars → {bytes_downloaded} bytes → {output_file_path}"
+            )
+            return True
+
+        except (AuthenticationError, NetworkError, TTSServiceError):
+            raise
         except Exception as e:
-            self.logger.warning(f"Failed to estimate output size: {e}")
-            return {
-                "estimated_duration_str": "Unknown",
-                "estimated_size_str": "Unknown",
-                "error": str(e)
-            }
-    
+            self.logger.error(f"Fish Audio TTS conversion failed: {e}")
+            raise TTSServiceError("Fish Audio", f"Conversion failed: {str(e)}")
+
+    async def text_to_speech_many(
+        self,
+        api_key: str,
+        items: List[tuple],
+        mp3_bitrate: int = 128,
+        extra_settings: Optional[Dict[str, Any]] = None,
+        max_concurrency: int = 20
+    ) -> List[bool]:
+        """
+        Convert several texts concurrently over the shared connection pool.
+
+        Args:
+            api_key (str): The API key for authentication
+            items (List[tuple]): (text, output_file_path, voice_or_model) triples
+            mp3_bitrate (int): MP3 bitrate (default: 128)
+            extra_settings (Optional[Dict[str, Any]]): Additional settings
+            max_concurrency (int): Maximum in-flight requests (rate-limit guard)
+
+        Returns:
+            List[bool]: Per-item success flags, in input order
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def convert_one(text, output_file_path, voice_or_model):
+            async with semaphore:
+                return await self.text_to_speech_async(
+                    api_key, text, output_file_path, voice_or_model,
+                    mp3_bitrate, extra_settings
+                )
+
+        outcomes = await asyncio.gather(
+            *(convert_one(*item) for item in items), return_exceptions=True
+        )
+
+        results: List[bool] = []
+        for item, outcome in zip(items, outcomes):
+            if isinstance(outcome, BaseException):
+                # One failed item must not discard the rest of the batch
+                self.logger.error(f"TTS conversion failed for {item[1]}: {outcome}")
+                results.append(False)
+            else:
+                results.append(outcome)
+        return results
+
+    async def text_to_speech_grouped(
+        self,
+        api_key: str,
+        items: List[tuple],
+        mp3_bitrate: int = 128,
+        extra_settings: Optional[Dict[str, Any]] = None,
+        max_concurrency: int = 20
+    ) -> List[bool]:
+        """
+        Convert texts one voice group at a time over the shared connection.
+
+        Requests for the same reference voice are dispatched together, so
+        the in-flight streams on the multiplexed HTTP/2 connection all hit
+        the same server-side voice-model cache entry instead of forcing a
+        re-lookup per request. Results come back in input order.
+
+        Args:
+            api_key (str): The API key for authentication
+            items (List[tuple]): (text, output_file_path, voice_or_model) triples
+            mp3_bitrate (int): MP3 bitrate (default: 128)
+            extra_settings (Optional[Dict[str, Any]]): Additional settings
+            max_concurrency (int): Maximum in-flight requests per group
+
+        Returns:
+            List[bool]: Per-item success flags, in input order
+        """
+        indexed = sorted(enumerate(items), key=lambda pair: pair[1][2])
+        results: List[bool] = [False] * len(items)
+
+        for _, group in itertools.groupby(indexed, key=lambda pair: pair[1][2]):
+            group = list(group)
+            flags = await self.text_to_speech_many(
+                api_key, [item for _, item in group],
+                mp3_bitrate, extra_settings, max_concurrency
+            )
+            for (index, _), flag in zip(group, flags):
+                results[index] = flag
+
+        return results
+
     def text_to_speech(
         self,
         api_key: str,
@@ -321,7 +758,7 @@ class FishTTSClient(TTSServiceInterface):
     ) -> bool:
         """
         Convert text to speech using Fish Audio API.
-        
+
         Args:
             api_key (str): The API key for authentication
             text (str): The text to convert to speech
@@ -330,281 +767,327 @@ class FishTTSClient(TTSServiceInterface):
             mp3_bitrate (int): MP3 bitrate (default: 128)
             extra_settings (Optional[Dict[str, Any]]): Additional settings
             progress_callback (Optional[callable]): Callback function for progress updates
-            
+
         Returns:
             bool: True if conversion was successful, False otherwise
         """
         try:
-            start_time = time.time()
-            
+            start_time = time.perf_counter()
+
             # Progress tracking stages
             if progress_callback:
                 progress_callback(5, "Preparing request...")
-            
-            # Use simple JSON request for better performance
-            request_data = {
-                "text": text,
-                "format": "mp3",
-                "mp3_bitrate": mp3_bitrate
-            }
-            
-            # Prepare headers
-            headers = {
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json"
-            }
-            
-            # Add model/voice handling
-            if voice_or_model and voice_or_model not in ["speech-1.6", "speech-1.5"]:
-                # Human voice model
-                request_data["reference_id"] = voice_or_model
-            else:
-                # AI model - use header
-                headers["model"] = voice_or_model
-            
+
+            request_body, headers, total_timeout = self._build_tts_request(
+                text, voice_or_model, mp3_bitrate
+            )
+
             if progress_callback:
                 progress_callback(10, "Sending request to Fish Audio API...")
-            
+
             log_api_request(self.logger, "Fish Audio", self.TTS_ENDPOINT)
-            self.logger.debug(f"TTS request: {len(text)} chars, voice: {voice_or_model}")
-            
-            # Calculate timeout based on text length
-            char_count = len(text)
-            base_timeout = 60  # 1 minute base
-            extra_timeout = min(240, char_count // 1000 * 10)  # 10 seconds per 1000 chars, max 4 minutes extra
-            total_timeout = base_timeout + extra_timeout
-            
-            # Make the API request with streaming to track progress
-            with httpx.Client() as client:
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("TTS request: %d chars, voice: %s", len(text), voice_or_model)
+
+            # Make the API request with streaming to track progress, reusing
+            # the pooled client instead of paying a handshake per call
+            client = self._get_client(api_key)
+
+            if progress_callback:
+                progress_callback(15, "Connecting to API...")
+
+            with client.stream(
+                "POST",
+                self._tts_url,
+                content=request_body,
+                headers=headers,
+                timeout=total_timeout
+            ) as response:
+
                 if progress_callback:
-                    progress_callback(15, "Connecting to API...")
-                
-                with client.stream(
-                    "POST",
-                    f"{self.BASE_URL}{self.TTS_ENDPOINT}",
-                    json=request_data,
-                    headers=headers,
-                    timeout=total_timeout
-                ) as response:
-                    
-                    if progress_callback:
-                        progress_callback(25, "Processing text with AI...")
-                    
-                    # Handle response status
-                    if response.status_code == 401:
-                        raise AuthenticationError("Fish Audio", "Invalid API key")
-                    elif response.status_code == 400:
-                        raise TTSServiceError("Fish Audio", "Bad request - check text and model parameters")
-                    elif response.status_code == 429:
-                        raise TTSServiceError("Fish Audio", "Rate limit exceeded - please wait and try again")
-                    elif response.status_code != 200:
-                        raise NetworkError(f"Fish Audio API error", response.status_code)
-                    
-                    if progress_callback:
-                        progress_callback(40, "Receiving audio data...")
-                    
-                    # Prepare output file for streaming write
-                    output_file_path = Path(output_file_path)
-                    output_file_path.parent.mkdir(parents=True, exist_ok=True)
-                    
-                    # Stream the response content directly to file with improved progress tracking
-                    content_length = response.headers.get('content-length')
-                    download_start_time = time.time()
-                    last_progress_update = download_start_time
-                    bytes_downloaded = 0
-                    last_reported_progress = 40
-                    
-                    with open(output_file_path, 'wb') as output_file:
-                        if content_length:
-                            content_length = int(content_length)
-                            
-                            for chunk in response.iter_bytes(chunk_size=8192):
-                                if not chunk:
-                                    continue
-                                    
-                                output_file.write(chunk)
-                                bytes_downloaded += len(chunk)
-                                
-                                # Update progress based on download (40% to 90% range)
-                                if progress_callback and content_length > 0:
-                                    download_progress = (bytes_downloaded / content_length) * 50  # 50% of total progress for download
-                                    total_progress = 40 + download_progress
-                                    
-                                    # Ensure smooth progression - never go backwards
-                                    current_progress = max(total_progress, last_reported_progress + 0.5)
-                                    current_progress = min(90, current_progress)  # Cap at 90%
-                                    
-                                    # Show data size in status
-                                    size_mb = bytes_downloaded / (1024 * 1024)
-                                    if size_mb > 1:
-                                        status = f"Downloading and saving audio... ({size_mb:.1f} MB)"
-                                    else:
-                                        status = f"Downloading and saving audio... ({bytes_downloaded // 1024} KB)"
-                                    
-                                    # Only update if progress increased significantly
-                                    if current_progress > last_reported_progress + 1:
-                                        progress_callback(int(current_progress), status)
-                                        last_reported_progress = current_progress
-                        else:
-                            # No content length - use improved time-based progress estimation
-                            base_progress = 40
-                            last_reported_progress = base_progress
-                            
-                            for chunk in response.iter_bytes(chunk_size=8192):
-                                if not chunk:
-                                    continue
-                                    
-                                output_file.write(chunk)
-                                bytes_downloaded += len(chunk)
-                                current_time = time.time()
-                                
-                                # Update progress more frequently for better user experience
-                                if progress_callback and (
-                                    current_time - last_progress_update > 0.5 or  # Update every 0.5 seconds
-                                    bytes_downloaded % (64 * 1024) == 0  # Or every 64KB
-                                ):
-                                    # Improved adaptive progress algorithm
-                                    elapsed_time = current_time - download_start_time
-                                    size_mb = bytes_downloaded / (1024 * 1024)
-                                    
-                                    # Dynamic progress calculation based on multiple factors
-                                    if size_mb > 2.0:
-                                        # Large files: more aggressive time-based progression
-                                        time_factor = min(40, elapsed_time / 8 * 40)  # 40% over 8 seconds
-                                        size_factor = min(10, size_mb * 2)  # 10% based on data size
-                                    elif size_mb > 1.0:
-                                        # Medium files: balanced progression
-                                        time_factor = min(35, elapsed_time / 10 * 35)  # 35% over 10 seconds
-                                        size_factor = min(15, size_mb * 3)  # 15% based on data size
-                                    else:
-                                        # Small files: more size-based progression
-                                        time_factor = min(30, elapsed_time / 12 * 30)  # 30% over 12 seconds
-                                        size_factor = min(20, size_mb * 8)  # 20% based on data size
-                                    
-                                    # Calculate new progress
-                                    estimated_progress = base_progress + time_factor + size_factor
-                                    
-                                    # Ensure smooth progression - never go backwards
-                                    current_progress = max(estimated_progress, last_reported_progress + 1)
-                                    
-                                    # Cap at 90% to leave room for final verification
-                                    current_progress = min(90, current_progress)
-                                    
-                                    # Show data size in status
-                                    if size_mb > 1:
-                                        status = f"Downloading and saving audio... ({size_mb:.1f} MB)"
-                                    else:
-                                        status = f"Downloading and saving audio... ({bytes_downloaded // 1024} KB)"
-                                    
-                                    # Only update if progress actually increased
-                                    if current_progress > last_reported_progress:
-                                        progress_callback(int(current_progress), status)
-                                        last_reported_progress = current_progress
-                                        last_progress_update = current_time
-            
-            api_time = time.time() - start_time
-            self.logger.debug(f"API response time: {api_time:.2f}s")
-            
+                    progress_callback(25, "Processing text with AI...")
+
+                # Handle response status
+                if response.status_code == 401:
+                    raise AuthenticationError("Fish Audio", "Invalid API key")
+                elif response.status_code == 400:
+                    raise TTSServiceError("Fish Audio", "Bad request - check text and model parameters")
+                elif response.status_code == 429:
+                    raise TTSServiceError("Fish Audio", "Rate limit exceeded - please wait and try again")
+                elif response.status_code != 200:
+                    raise NetworkError(f"Fish Audio API error", response.status_code)
+
+                if progress_callback:
+                    progress_callback(40, "Receiving audio data...")
+
+                # Prepare output file for streaming write
+                self._ensure_parent_dir(output_file_path)
+
+                # Stream the response to file; one loop covers both known and
+                # unknown content length, and progress reporting is throttled
+                # by time so per-chunk Python work stays minimal
+                content_length = int(response.headers.get('content-length') or 0)
+                download_start_time = time.monotonic()
+                next_progress_time = download_start_time + 0.25
+                bytes_downloaded = 0
+                last_reported_progress = 40
+
+                # Raw fd writes skip the io-module buffer copy; the audio
+                # won't be re-read soon, so drop it from the page cache too
+                fd = os.open(str(output_file_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    # iter_raw skips the content-decoding layer (audio is
+                    # never content-encoded), saving one copy per chunk
+                    chunks = response.iter_raw(chunk_size=131072)
+
+                    if progress_callback is None:
+                        # Fast path: raw chunks straight to the fd, no
+                        # per-chunk progress bookkeeping at all
+                        for chunk in chunks:
+                            _write_all(fd, chunk)
+                            bytes_downloaded += len(chunk)
+                    else:
+                        for chunk in chunks:
+                            if not chunk:
+                                continue
+
+                            _write_all(fd, chunk)
+                            bytes_downloaded += len(chunk)
+
+                            now = time.monotonic()
+                            if now >= next_progress_time:
+                                next_progress_time = now + 0.25
+                                current_progress = self._download_progress(
+                                    bytes_downloaded, content_length,
+                                    now - download_start_time, last_reported_progress
+                                )
+
+                                # Show data size in status
+                                size_mb = bytes_downloaded / (1024 * 1024)
+                                if size_mb > 1:
+                                    status = f"Downloading and saving audio... ({size_mb:.1f} MB)"
+                                else:
+                                    status = f"Downloading and saving audio... ({bytes_downloaded // 1024} KB)"
+
+                                if current_progress > last_reported_progress:
+                                    progress_callback(int(current_progress), status)
+                                    last_reported_progress = current_progress
+                finally:
+                    # Tell the kernel we won't re-read what we just wrote
+                    try:
+                        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+                    except (AttributeError, OSError):
+                        pass
+                    os.close(fd)
+
+            api_time = time.perf_counter() - start_time
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("API response time: %.2fs", api_time)
+
             if progress_callback:
                 progress_callback(95, "Verifying file...")
-            
-            # Verify file was written
-            if not output_file_path.exists() or output_file_path.stat().st_size == 0:
+
+            # Verify data was written (the byte count we accumulated saves a
+            # stat syscall)
+            if bytes_downloaded == 0:
                 raise TTSServiceError("Fish Audio", "Failed to save audio file")
-            
-            file_size = output_file_path.stat().st_size
-            self.logger.debug(f"Received and saved {file_size} bytes of audio data")
-            
+
+            file_size = bytes_downloaded
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Received and saved %d bytes of audio data", file_size)
+
             if progress_callback:
                 progress_callback(100, "Conversion complete!")
-            
-            total_time = time.time() - start_time
-            
-            # Verify file was written
-            if not output_file_path.exists() or output_file_path.stat().st_size == 0:
-                raise TTSServiceError("Fish Audio", "Failed to save audio file")
-            
+
+            total_time = time.perf_counter() - start_time
+
             self.logger.info(
                 f"TTS conversion successful: {len(text)} chars → {file_size} bytes → {output_file_path}"
             )
-            self.logger.debug(f"Total time: {total_time:.2f}s (API: {api_time:.2f}s)")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Total time: %.2fs (API: %.2fs)", total_time, api_time)
             return True
-            
+
         except (AuthenticationError, NetworkError, TTSServiceError):
             raise
         except Exception as e:
             self.logger.error(f"Fish Audio TTS conversion failed: {e}")
             raise TTSServiceError("Fish Audio", f"Conversion failed: {str(e)}")
-    
+
     def get_required_config_fields(self) -> List[str]:
         """Get the list of required configuration fields."""
         return ["api_key"]
-    
+
     def validate_api_key(self, api_key: str) -> bool:
         """
         Validate the Fish Audio API key.
-        
+
         Args:
             api_key (str): The API key to validate
-            
+
         Returns:
             bool: True if API key is valid, False otherwise
         """
         try:
             if not api_key or not api_key.strip():
                 return False
-            
+
+            # Reject obviously malformed keys before any network work
+            if not _API_KEY_RE.match(api_key.strip()):
+                return False
+
+            # Check the TTL cache first; key on a hash so raw keys never sit
+            # in memory longer than needed.
+            key_hash = hashlib.blake2b(api_key.encode(), digest_size=16).hexdigest()
+            cached = self._validation_cache.get(key_hash)
+            if cached is not None and time.monotonic() - cached[0] < self._VALIDATION_TTL:
+                return cached[1]
+
             client = self._get_client(api_key)
-            
+
             # Try to get models as a validation check
             response = client.get(
-                f"{self.BASE_URL}{self.MODELS_ENDPOINT}",
+                self._models_url,
                 timeout=10.0
             )
-            
-            return response.status_code == 200
-            
+
+            result = response.status_code == 200
+            self._validation_cache[key_hash] = (time.monotonic(), result)
+            return result
+
         except Exception as e:
-            self.logger.debug(f"API key validation failed: {e}")
+            self.logger.debug("API key validation failed: %s", e)
             return False
-    
+
     def get_default_voice(self) -> str:
         """Get the default voice/model for Fish Audio."""
         return "b545c585f631496c914815291da4e893"
-    
+
     def get_character_limit(self) -> Optional[int]:
         """Get the character limit for Fish Audio (if any)."""
         # Fish Audio doesn't specify a hard limit, but we'll set a reasonable one
         return 10000  # 10k characters per request
-    
+
     def _get_client(self, api_key: str) -> httpx.Client:
         """
         Get or create an HTTP client with proper configuration.
-        
+
         Args:
             api_key (str): API key for authentication
-            
+
         Returns:
             httpx.Client: Configured HTTP client
         """
         if not self._client:
+            # One pooled HTTP/2 client for all TTS/model calls: keep-alive
+            # amortizes the TCP+TLS handshake across requests and HTTP/2
+            # multiplexes concurrent streams over the same connection
             self._client = httpx.Client(
+                http2=True,
+                transport=httpx.HTTPTransport(retries=1),
                 headers={
                     "Authorization": f"Bearer {api_key}",
+                    "Content-Type": "application/msgpack",
                     "User-Agent": "VoiceForge/1.0.0"
                 },
-                timeout=30.0
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=20,
+                    keepalive_expiry=60.0
+                ),
+                timeout=httpx.Timeout(30.0, connect=5.0)
             )
-        else:
-            # Update authorization header
+            atexit.register(self.close)
+            self._last_api_key = api_key
+        elif api_key != self._last_api_key:
+            # Update authorization header only when the key actually changed
             self._client.headers["Authorization"] = f"Bearer {api_key}"
-        
+            self._last_api_key = api_key
+
         return self._client
-    
-    def __del__(self):
-        """Clean up HTTP client on destruction."""
+
+    def close(self) -> None:
+        """Close the pooled HTTP client."""
         if self._client:
             try:
                 self._client.close()
             except Exception:
-                pass 
\ No newline at end of file
+                pass
+            self._client = None
+
+    def __del__(self):
+        """Clean up HTTP client on destruction."""
+        self.close()
+
+
+class FishTTSPool:
+    """
+    Bounded pool of in-flight TTS requests over one shared async client.
+
+    Callers converting many chunks (e.g. a chaptered book) submit work as
+    it becomes available instead of batching up-front; the pool keeps up
+    to `concurrency` requests on the wire at a time, all multiplexed over
+    the client's keep-alive HTTP/2 connection.
+    """
+
+    def __init__(self, client: FishTTSClient, concurrency: int = 8):
+        """
+        Args:
+            client (FishTTSClient): The client whose async path to drive
+            concurrency (int): Maximum in-flight requests
+        """
+        self._client = client
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+    def submit(
+        self,
+        api_key: str,
+        text: str,
+        output_file_path: Path,
+        voice_or_model: str,
+        mp3_bitrate: int = 128,
+        extra_settings: Optional[Dict[str, Any]] = None
+    ) -> "asyncio.Task":
+        """Schedule one conversion and return its task immediately."""
+        return asyncio.create_task(self._convert(
+            api_key, text, output_file_path, voice_or_model,
+            mp3_bitrate, extra_settings
+        ))
+
+    async def _convert(self, api_key, text, output_file_path, voice_or_model,
+                       mp3_bitrate, extra_settings):
+        async with self._semaphore:
+            return await self._client.text_to_speech_async(
+                api_key, text, output_file_path, voice_or_model,
+                mp3_bitrate, extra_settings
+            )
+
+    async def map(
+        self,
+        api_key: str,
+        items: List[tuple],
+        mp3_bitrate: int = 128,
+        extra_settings: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Yield per-item success flags as conversions complete.
+
+        Args:
+            api_key (str): The API key for authentication
+            items (List[tuple]): (text, output_file_path, voice_or_model) triples
+
+        Yields:
+            bool: Success flag for each finished conversion (completion order)
+        """
+        tasks = [
+            self.submit(api_key, text, output_file_path, voice_or_model,
+                        mp3_bitrate, extra_settings)
+            for text, output_file_path, voice_or_model in items
+        ]
+        for task in asyncio.as_completed(tasks):
+            try:
+                yield await task
+            except Exception as e:
+                # Keep draining the remaining tasks on a per-item failure
+                self._client.logger.error(f"Pooled TTS conversion failed: {e}")
+                yield False
@@ -4,7 +4,8 @@ TTS Service Factory
 Factory class for creating TTS service instances based on provider names.
 """
 
-from typing import Dict, Type, List, Optional
+import importlib
+from typing import Dict, Tuple, Type, List, Optional
 from ..interfaces.tts_service_interface import TTSServiceInterface
 from ..utils.exceptions import ConfigurationError
 from ..utils.logger import get_logger
@@ -12,28 +13,50 @@ from ..utils.logger import get_logger
 
 class TTSServiceFactory:
     """Factory for creating TTS service instances."""
-    
+
     _providers: Dict[str, Type[TTSServiceInterface]] = {}
+    _instances: Dict[str, TTSServiceInterface] = {}
     _logger = get_logger(__name__)
-    
+
+    # Default providers are registered lazily as (module, class name) pairs
+    # so importing the factory doesn't drag in httpx and friends for CLI
+    # commands that never create a service
+    _lazy_providers: Dict[str, Tuple[str, str]] = {
+        "fish_audio": (".fish_tts_client", "FishTTSClient"),
+    }
+
     @classmethod
     def register_provider(cls, name: str, provider_class: Type[TTSServiceInterface]) -> None:
         """Register a TTS service provider."""
         cls._providers[name] = provider_class
         cls._logger.debug(f"Registered TTS provider: {name}")
-    
+
+    @classmethod
+    def _resolve_provider(cls, provider_name: str) -> Optional[Type[TTSServiceInterface]]:
+        """Get the provider class, importing a lazily registered one on demand."""
+        provider_class = cls._providers.get(provider_name)
+        if provider_class is None and provider_name in cls._lazy_providers:
+            module_path, class_name = cls._lazy_providers[provider_name]
+            try:
+                module = importlib.import_module(module_path, package=__package__)
+            except ImportError as e:
+                cls._logger.warning(f"Failed to load TTS provider '{provider_name}': {e}")
+                return None
+            provider_class = getattr(module, class_name)
+            cls.register_provider(provider_name, provider_class)
+        return provider_class
+
     @classmethod
     def create_service(cls, provider_name: str) -> TTSServiceInterface:
         """Create a TTS service instance."""
-        if provider_name not in cls._providers:
-            available = ", ".join(cls._providers.keys())
+        provider_class = cls._resolve_provider(provider_name)
+        if provider_class is None:
+            available = ", ".join(cls.get_available_providers())
             raise ConfigurationError(
                 provider_name,
                 f"Unknown TTS provider '{provider_name}'. Available: {available}"
             )
-        
-        provider_class = cls._providers[provider_name]
-        
+
         try:
             instance = provider_class()
             cls._logger.debug(f"Created TTS service instance: {provider_name}")
@@ -43,27 +66,26 @@ class TTSServiceFactory:
                 provider_name,
                 f"Failed to create TTS service '{provider_name}': {str(e)}"
             )
-    
+
+    @classmethod
+    def get_shared_service(cls, provider_name: str) -> TTSServiceInterface:
+        """Get a memoized service instance for the provider.
+
+        Service clients are configured per request, so callers that don't
+        need a private instance can share one and keep its connection pool
+        and caches warm across calls.
+        """
+        instance = cls._instances.get(provider_name)
+        if instance is None:
+            instance = cls._instances[provider_name] = cls.create_service(provider_name)
+        return instance
+
     @classmethod
     def get_available_providers(cls) -> List[str]:
         """Get list of available provider names."""
-        return list(cls._providers.keys())
-    
+        return list(cls._providers.keys() | cls._lazy_providers.keys())
+
     @classmethod
     def is_provider_available(cls, provider_name: str) -> bool:
         """Check if a provider is available."""
-        return provider_name in cls._providers
-
-
-# Auto-register Fish Audio provider
-def _register_default_providers():
-    """Register default TTS providers."""
-    try:
-        from .fish_tts_client import FishTTSClient
-        TTSServiceFactory.register_provider("fish_audio", FishTTSClient)
-    except ImportError as e:
-        TTSServiceFactory._logger.warning(f"Failed to register Fish Audio provider: {e}")
-
-
-# Register providers on module import
-_register_default_providers() 
\ No newline at end of file
+        return provider_name in cls._providers or provider_name in cls._lazy_providers
@@ -2,78 +2,128 @@
 VoiceForge Custom Exceptions
 
 Custom exception classes for better error handling and user feedback.
+
+Messages are formatted lazily in __str__ from the raw parts stored at
+raise time, so raise/catch pairs whose message is never read skip the
+string building entirely.
 """
 
+from enum import IntEnum
+
+
+class ErrorKind(IntEnum):
+    """Cheap category tag carried by every VoiceForgeError.
+
+    Handlers on hot paths can branch on `e.kind is ErrorKind.AUTH`
+    instead of walking the class hierarchy with isinstance().
+    """
+
+    GENERIC = 0
+    AUTH = 1
+    NETWORK = 2
+    FILE = 3
+    CONFIG = 4
+    TTS = 5
+    COST = 6
+
 
 class VoiceForgeError(Exception):
     """Base exception class for VoiceForge application."""
-    
-    def __init__(self, message: str, details: str = None):
+
+    __slots__ = ('message', 'details', 'kind')
+
+    def __init__(self, message: str = None, details: str = None, kind: ErrorKind = ErrorKind.GENERIC):
         self.message = message
         self.details = details
-        super().__init__(self.message)
+        self.kind = kind
+        Exception.__init__(self)
+
+    def _default_message(self) -> str:
+        """Fallback message built from raw parts when none was given."""
+        return "VoiceForge error"
 
     def __str__(self):
+        message = self.message if self.message is not None else self._default_message()
         if self.details:
-            return f"{self.message}: {self.details}"
-        return self.message
+            return f"{message}: {self.details}"
+        return message
 
 
 class AuthenticationError(VoiceForgeError):
     """Raised when API authentication fails."""
-    
+
+    __slots__ = ('provider',)
+
     def __init__(self, provider: str, message: str = None):
         self.provider = provider
-        if not message:
-            message = f"Authentication failed for {provider}"
-        super().__init__(message)
+        super().__init__(message, kind=ErrorKind.AUTH)
+
+    def _default_message(self) -> str:
+        return f"Authentication failed for {self.provider}"
 
 
 class NetworkError(VoiceForgeError):
     """Raised when network operations fail."""
-    
+
+    __slots__ = ('status_code',)
+
     def __init__(self, message: str = "Network operation failed", status_code: int = None):
         self.status_code = status_code
-        if status_code:
-            message = f"{message} (HTTP {status_code})"
-        super().__init__(message)
+        super().__init__(message, kind=ErrorKind.NETWORK)
+
+    def __str__(self):
+        if self.status_code:
+            return f"{self.message} (HTTP {self.status_code})"
+        return self.message
 
 
 class FileError(VoiceForgeError):
     """Raised when file operations fail."""
-    
+
+    __slots__ = ('file_path', 'operation')
+
     def __init__(self, file_path: str, operation: str, message: str = None):
         self.file_path = file_path
         self.operation = operation
-        if not message:
-            message = f"Failed to {operation} file: {file_path}"
-        super().__init__(message)
+        super().__init__(message, kind=ErrorKind.FILE)
+
+    def _default_message(self) -> str:
+        return f"Failed to {self.operation} file: {self.file_path}"
 
 
 class ConfigurationError(VoiceForgeError):
     """Raised when configuration is invalid or missing."""
-    
+
+    __slots__ = ('config_key',)
+
     def __init__(self, config_key: str = None, message: str = None):
         self.config_key = config_key
-        if not message:
-            if config_key:
-                message = f"Invalid or missing configuration: {config_key}"
-            else:
-                message = "Configuration error"
-        super().__init__(message)
+        super().__init__(message, kind=ErrorKind.CONFIG)
+
+    def _default_message(self) -> str:
+        if self.config_key:
+            return f"Invalid or missing configuration: {self.config_key}"
+        return "Configuration error"
 
 
 class TTSServiceError(VoiceForgeError):
     """Raised when TTS service operations fail."""
-    
+
+    __slots__ = ('provider', 'error_code')
+
     def __init__(self, provider: str, message: str, error_code: str = None):
         self.provider = provider
         self.error_code = error_code
-        super().__init__(f"{provider}: {message}")
+        super().__init__(message, kind=ErrorKind.TTS)
+
+    def __str__(self):
+        return f"{self.provider}: {self.message}"
 
 
 class CostEstimationError(VoiceForgeError):
     """Raised when cost estimation fails."""
-    
+
+    __slots__ = ()
+
     def __init__(self, message: str = "Failed to estimate cost"):
-        super().__init__(message) 
\ No newline at end of file
+        super().__init__(message, kind=ErrorKind.COST)
@@ -4,17 +4,76 @@ VoiceForge Logging Utility
 Provides centralized logging configuration for the VoiceForge application.
 """
 
+import atexit
+import contextlib
+import functools
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 from typing import Optional
 
+# Precomputed level names; avoids getattr reflection on every call
+_LEVEL_MAP = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+# One shared formatter; building one per get_logger call recompiles
+# the format string each time
+_FORMATTER = logging.Formatter(
+    fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+# Flood-friendly variant: %(created).3f reuses the float timestamp
+# already on the record, skipping the localtime/strftime call that
+# %(asctime)s makes for every line
+_FAST_FORMATTER = logging.Formatter(
+    fmt='%(created).3f - %(name)s - %(levelname)s - %(message)s'
+)
+
+# Names of loggers get_logger has already configured; lets repeat
+# calls return without touching the logger's handler list
+_CONFIGURED: set = set()
+
+# Log directories we have already created; skips the ancestor stat
+# cascade of mkdir(parents=True) on repeat logger setups
+_ensured_dirs: set = set()
+
+
+def _stop_listener(listener: "logging.handlers.QueueListener") -> None:
+    """Stop a queue listener and flush its handlers on the way out."""
+    if listener._thread is not None:
+        listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """FileHandler whose stream carries a 64KB userspace buffer.
+
+    Records accumulate in memory and reach the disk in large chunks,
+    so a chatty batch run is a steady low-frequency writer instead of
+    a stream of small writes competing with audio-file output.
+    """
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=1 << 16,
+                    encoding=self.encoding)
+
 
 def get_logger(
     name: str = "voiceforge",
     level: str = "INFO",
     log_file: Optional[Path] = None,
-    console_output: bool = True
+    console_output: bool = True,
+    direct_io: bool = False,
+    fast_time: bool = False
 ) -> logging.Logger:
     """
     Get a configured logger for VoiceForge.
@@ -24,25 +83,50 @@ def get_logger(
         level (str): Logging level (default: "INFO")
         log_file (Optional[Path]): Path to log file (optional)
         console_output (bool): Whether to output to console (default: True)
+        direct_io (bool): Buffer file writes in 64KB chunks for
+            high-volume batch runs (default: False)
+        fast_time (bool): Timestamp records with the raw epoch float
+            instead of formatted local time; cheaper under DEBUG
+            floods (default: False)
         
     Returns:
         logging.Logger: Configured logger instance
     """
+    return _get_logger_cached(
+        name, level, str(log_file) if log_file else None,
+        console_output, direct_io, fast_time
+    )
+
+
+@functools.lru_cache(maxsize=16)
+def _get_logger_cached(
+    name: str,
+    level: str,
+    log_file: Optional[str],
+    console_output: bool,
+    direct_io: bool,
+    fast_time: bool
+) -> logging.Logger:
+    """Configure-once worker behind get_logger; args are normalized
+    hashables so identical calls return straight from the cache."""
+    if name in _CONFIGURED:
+        return logging.getLogger(name)
+
     logger = logging.getLogger(name)
     
     # Avoid adding handlers multiple times
     if logger.handlers:
+        _CONFIGURED.add(name)
         return logger
     
     # Set logging level
-    numeric_level = getattr(logging, level.upper(), logging.INFO)
+    if isinstance(level, str):
+        numeric_level = _LEVEL_MAP.get(level.upper(), logging.INFO)
+    else:
+        numeric_level = level
     logger.setLevel(numeric_level)
-    
-    # Create formatter
-    formatter = logging.Formatter(
-        fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+
+    formatter = _FAST_FORMATTER if fast_time else _FORMATTER
     
     # Console handler
     if console_output:
@@ -54,17 +138,44 @@ def get_logger(
     # File handler (if specified)
     if log_file:
         try:
-            # Ensure log directory exists
-            log_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            file_handler = logging.FileHandler(log_file)
+            # Ensure log directory exists (once per directory)
+            log_path = Path(log_file)
+            log_dir = log_path.parent
+            if log_dir not in _ensured_dirs:
+                log_dir.mkdir(parents=True, exist_ok=True)
+                _ensured_dirs.add(log_dir)
+
+            if direct_io:
+                file_handler = _BufferedFileHandler(log_path)
+            else:
+                file_handler = logging.FileHandler(log_path)
             file_handler.setLevel(numeric_level)
             file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
+
+            # Coalesce records in memory so the file sees one write per
+            # batch instead of one per record; errors flush immediately
+            buffered_handler = logging.handlers.MemoryHandler(
+                capacity=512, flushLevel=logging.ERROR, target=file_handler
+            )
+
+            # Hand records off to a background listener thread so log calls
+            # on hot paths are a queue.put instead of a blocking write()
+            log_queue = queue.Queue(-1)
+            queue_handler = logging.handlers.QueueHandler(log_queue)
+            queue_handler.setLevel(numeric_level)
+            logger.addHandler(queue_handler)
+
+            listener = logging.handlers.QueueListener(
+                log_queue, buffered_handler, respect_handler_level=True
+            )
+            listener.start()
+            logger._vf_listener = listener
+            atexit.register(_stop_listener, listener)
         except Exception as e:
             # If file logging fails, log to console
             logger.warning(f"Failed to set up file logging: {e}")
     
+    _CONFIGURED.add(name)
     return logger
 
 
@@ -96,41 +207,110 @@ def setup_application_logging(
     )
 
 
-def log_api_request(logger: logging.Logger, provider: str, endpoint: str, method: str = "POST"):
+_DEFAULT_LOGGER: Optional[logging.Logger] = None
+
+
+def _get_default_logger() -> logging.Logger:
+    """Return the shared application logger, creating it on first use."""
+    global _DEFAULT_LOGGER
+    if _DEFAULT_LOGGER is None:
+        _DEFAULT_LOGGER = get_logger("voiceforge")
+    return _DEFAULT_LOGGER
+
+
+def log_api_request(logger: Optional[logging.Logger] = None, provider: str = "", endpoint: str = "", method: str = "POST"):
     """
     Log API request information (without sensitive data).
     
     Args:
-        logger (logging.Logger): Logger instance
+        logger (Optional[logging.Logger]): Logger instance (default: shared app logger)
         provider (str): TTS provider name
         endpoint (str): API endpoint (without sensitive parameters)
         method (str): HTTP method (default: "POST")
     """
-    logger.debug(f"API Request: {method} {provider} - {endpoint}")
+    if logger is None:
+        logger = _get_default_logger()
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("API Request: %s %s - %s", method, provider, endpoint)
 
 
-def log_file_operation(logger: logging.Logger, operation: str, file_path: Path, success: bool = True):
+def log_file_operation(logger: Optional[logging.Logger] = None, operation: str = "", file_path: Optional[Path] = None, success: bool = True):
     """
     Log file operation information.
     
     Args:
-        logger (logging.Logger): Logger instance
+        logger (Optional[logging.Logger]): Logger instance (default: shared app logger)
         operation (str): Operation type (e.g., "read", "write")
         file_path (Path): File path
         success (bool): Whether operation was successful
     """
-    status = "SUCCESS" if success else "FAILED"
-    logger.debug(f"File {operation}: {file_path} - {status}")
+    if logger is None:
+        logger = _get_default_logger()
+    if logger.isEnabledFor(logging.DEBUG):
+        status = "SUCCESS" if success else "FAILED"
+        logger.debug("File %s: %s - %s", operation, file_path, status)
 
 
-def log_cost_estimation(logger: logging.Logger, provider: str, characters: int, estimated_cost: str):
+def log_cost_estimation(logger: Optional[logging.Logger] = None, provider: str = "", characters: int = 0, estimated_cost: str = ""):
     """
     Log cost estimation information.
     
     Args:
-        logger (logging.Logger): Logger instance
+        logger (Optional[logging.Logger]): Logger instance (default: shared app logger)
         provider (str): TTS provider name
         characters (int): Number of characters
         estimated_cost (str): Estimated cost string
     """
-    logger.info(f"Cost estimate ({provider}): {characters} chars → {estimated_cost}") 
\ No newline at end of file
+    if logger is None:
+        logger = _get_default_logger()
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Cost estimate (%s): %d chars -> %s", provider, characters, estimated_cost)
+
+
+def log_many_cost_estimates(logger: Optional[logging.Logger] = None, provider: str = "", records: list = None):
+    """
+    Log cost estimates for a batch of texts as a single record.
+    
+    Args:
+        logger (Optional[logging.Logger]): Logger instance (default: shared app logger)
+        provider (str): TTS provider name
+        records (list): (characters, estimated_cost) tuples, one per text
+    """
+    if logger is None:
+        logger = _get_default_logger()
+    if not records or not logger.isEnabledFor(logging.INFO):
+        return
+    total_chars = sum(characters for characters, _ in records)
+    logger.info("Cost estimate (%s): %d texts, %d chars total",
+                provider, len(records), total_chars)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Cost estimate detail (%s): %r", provider, records)
+
+
+@contextlib.contextmanager
+def batched_logging(logger: Optional[logging.Logger] = None, capacity: int = 1024):
+    """
+    Buffer a logger's output for the duration of a batch operation.
+
+    Wraps each of the logger's handlers in a MemoryHandler so records
+    emitted inside the block reach the real handlers in one flush at
+    exit (errors still flush immediately).
+
+    Args:
+        logger (Optional[logging.Logger]): Logger instance (default: shared app logger)
+        capacity (int): Records to buffer before an early flush (default: 1024)
+    """
+    if logger is None:
+        logger = _get_default_logger()
+    original = logger.handlers[:]
+    buffered = [
+        logging.handlers.MemoryHandler(capacity, target=handler)
+        for handler in original
+    ]
+    logger.handlers = buffered
+    try:
+        yield logger
+    finally:
+        logger.handlers = original
+        for handler in buffered:
+            handler.close()
@@ -3,51 +3,79 @@
 VoiceForge Standalone Entry Point
 
 This is the main entry point for the standalone VoiceForge executable.
-It avoids relative import issues that can occur with PyInstaller.
+It avoids relative import issues that can occur with PyInstaller, and
+answers --version without importing the CLI stack.
 """
 
 import sys
 import os
-from pathlib import Path
 
-# Add the source directory to Python path
+# Add the source directory to Python path; plain os.path strings keep
+# the cold path free of PurePath allocations
 if getattr(sys, 'frozen', False):
+    # Bundle ships precompiled .pyc; never write stray bytecode at runtime
+    sys.dont_write_bytecode = True
+
     # Running as compiled executable - PyInstaller extracts to _MEIPASS
-    if hasattr(sys, '_MEIPASS'):
-        # PyInstaller temporary directory
-        application_path = Path(sys._MEIPASS)
-    else:
-        application_path = Path(sys.executable).parent
+    application_path = getattr(sys, '_MEIPASS', None) or os.path.dirname(sys.executable)
+
+    # The bundled layout is guaranteed in frozen builds; no stat probes
+    src_path = os.path.join(application_path, "src")
+    sys.path.insert(0, src_path)
 else:
     # Running as script
-    application_path = Path(__file__).parent
+    application_path = os.path.dirname(os.path.abspath(__file__))
+
+    src_path = os.path.join(application_path, "src")
+    if os.path.isdir(src_path):
+        sys.path.insert(0, src_path)
+    else:
+        # Fallback: first location that actually contains the package
+        found = next(
+            (path for path in (src_path,
+                               application_path,
+                               os.path.join(os.path.dirname(application_path), "src"))
+             if os.path.isdir(os.path.join(path, "voiceforge"))),
+            None
+        )
+        if found is not None:
+            sys.path.insert(0, found)
+
+
+def _print_import_diagnostics(error) -> None:
+    """Explain a failed CLI import; only built when the failure occurs."""
+    print(f"[ERROR] Import error: {error}")
+    print("Please ensure VoiceForge is properly installed.")
+    print(f"Python path: {sys.path}")
+    print(f"Application path: {application_path}")
+    print(f"Source path: {src_path}")
+
+
+def _fast_path(argv) -> bool:
+    """Answer --version without importing the CLI stack.
+
+    Only --version is safe to intercept: its one-line output matches
+    click's exactly. Help and the no-argument case go through the real
+    CLI so users get the full rendered document and click's exit codes.
+    """
+    if not argv or argv[0] != "--version":
+        return False
+
+    # _meta is a leaf module: importing it skips the package __init__
+    from voiceforge._meta import __version__, __app_name__
+
+    print(f"{__app_name__}, version {__version__}")
+    return True
+
+
+if __name__ == '__main__':
+    if _fast_path(sys.argv[1:]):
+        sys.exit(0)
+
+    # Import the CLI only when --version did not short-circuit
+    try:
+        from voiceforge.cli.main import cli
 
-# Add src directory to path for imports
-src_path = application_path / "src"
-if src_path.exists():
-    sys.path.insert(0, str(src_path))
-else:
-    # Fallback: try to find voiceforge module in current directory structure
-    current_dir = Path(__file__).parent
-    possible_paths = [
-        current_dir / "src",
-        current_dir,
-        current_dir.parent / "src"
-    ]
-    
-    for path in possible_paths:
-        if (path / "voiceforge").exists():
-            sys.path.insert(0, str(path))
-            break
-
-# Now import and run the main CLI
-try:
-    # Import all necessary components
-    from voiceforge.cli.main import cli, CLIContext, pass_context
-    from voiceforge import __version__, __app_name__
-    import click
-    
-    if __name__ == '__main__':
         # Ensure the CLI is called with proper context
         # This helps preserve the docstrings and help text
         try:
@@ -58,14 +86,10 @@ try:
         except Exception as e:
             print(f"[ERROR] CLI error: {e}")
             sys.exit(1)
-        
-except ImportError as e:
-    print(f"[ERROR] Import error: {e}")
-    print("Please ensure VoiceForge is properly installed.")
-    print(f"Python path: {sys.path}")
-    print(f"Application path: {application_path}")
-    print(f"Source path: {src_path}")
-    sys.exit(1)
-except Exception as e:
-    print(f"[ERROR] Fatal error: {e}")
-    sys.exit(1) 
\ No newline at end of file
+
+    except ImportError as e:
+        _print_import_diagnostics(e)
+        sys.exit(1)
+    except Exception as e:
+        print(f"[ERROR] Fatal error: {e}")
+        sys.exit(1)